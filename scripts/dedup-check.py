@@ -13,11 +13,35 @@ If not specified, the current directory is used.
 
 import argparse
 import json
+import mmap
 import os
 import re
 import sys
 import time
 
+# Optional fast JSON for index I/O — same soft-dependency pattern as
+# tgcm.py/validate-queue.py; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a bytes-like object with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if not isinstance(data, (str, bytes, bytearray)):
+        data = bytes(data)  # stdlib json can't parse memoryview
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj):
+    """Serialize *obj* to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 def get_paths(base_dir):
     """Return paths to index and log files."""
@@ -34,13 +58,23 @@ def log_perf(perf_log, action, duration_ms, details=""):
         f.write(f"{ts} | {action} | {duration_ms:.0f}ms | {details}\n")
 
 
+# Below this size a plain read() is cheaper than setting up a mapping.
+MMAP_THRESHOLD = 64 * 1024
+
+
 def load_index(index_file):
     if not os.path.exists(index_file):
         return []
     try:
-        with open(index_file, "r") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+        with open(index_file, "rb") as f:
+            if os.path.getsize(index_file) > MMAP_THRESHOLD:
+                # Parse straight out of the page cache instead of
+                # copying the whole file into a bytes object first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = _json_loads(memoryview(mm))
+            else:
+                data = _json_loads(f.read())
+    except (ValueError, OSError) as e:
         print(f"Warning: corrupt index {index_file}: {e}", file=sys.stderr)
         return []
     if isinstance(data, dict) and "posts" in data:
@@ -53,49 +87,80 @@ def save_index(index_file, index):
     wrapper = None
     if os.path.exists(index_file):
         try:
-            with open(index_file, "r") as f:
-                existing = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(index_file, "rb") as f:
+                existing = _json_loads(f.read())
+        except (ValueError, OSError):
             existing = None
         if isinstance(existing, dict) and "version" in existing:
             wrapper = {"version": existing["version"], "posts": index}
-    with open(index_file, 'w') as f:
-        json.dump(wrapper if wrapper else index, f, ensure_ascii=False, indent=2)
+    # Temp file + atomic rename: an interrupted write can never leave a
+    # truncated index behind for load_index's corrupt-file path to find
+    tmp = index_file + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_json_dumps(wrapper if wrapper else index))
+    os.replace(tmp, index_file)
+
+
+STOPWORDS = frozenset({
+    'this', 'that', 'with', 'from', 'have', 'been', 'will', 'what', 'when',
+    'which', 'their', 'about', 'would', 'could', 'should', 'more', 'some',
+    'into', 'than', 'other', 'these', 'those', 'just', 'also', 'only',
+    'agent', 'agents',
+})
+
+# Keyword tokenization shared with validate-queue.py/tgcm.py (CLAUDE.md)
+KEYWORD_RE = re.compile(r'[^\W\d_]{4,}', re.UNICODE)
 
 
 def check_topic(topic, index):
     """Check topic by keywords. Returns a list of matches."""
-    topic_words = set(re.findall(r'[^\W\d_]{4,}', topic.lower(), re.UNICODE))
-    stop = {'this', 'that', 'with', 'from', 'have', 'been', 'will', 'what', 'when',
-            'which', 'their', 'about', 'would', 'could', 'should', 'more', 'some',
-            'into', 'than', 'other', 'these', 'those', 'just', 'also', 'only',
-            'agent', 'agents'}
-    topic_words -= stop
+    topic_words = set(KEYWORD_RE.findall(topic.lower())) - STOPWORDS
+    # A match needs overlap >= 2, and no overlap (exact or stem) can
+    # exceed the smaller of the two word sets — a one-word topic can
+    # never match, and neither can a one-word post
+    if len(topic_words) < 2:
+        return []
+    # Fuzzy side: common stem (first 5 chars), hoisted out of the loop
+    topic_stems = {w[:5] for w in topic_words if len(w) >= 5}
+    topic_n = len(topic_words)
+    topic_stems_n = len(topic_stems)
 
     matches = []
     for post in index:
-        post_words = set(w.lower() for w in post.get('keywords', []))
-        post_words -= stop
-        if not topic_words or not post_words:
+        post_words = {w.lower() for w in post.get('keywords', [])} - STOPWORDS
+        if len(post_words) < 2:
             continue
-        # Exact match
+
+        # Exact match first; the stem overlap can never exceed the
+        # smaller stem set, so skip building the stems when the exact
+        # overlap already meets that bound
         overlap = topic_words & post_words
-        # Fuzzy: common stem (first 5 chars)
-        topic_stems = {w[:5] for w in topic_words if len(w) >= 5}
-        post_stems = {w[:5] for w in post_words if len(w) >= 5}
-        stem_overlap = topic_stems & post_stems
-        # Take the best of both methods
-        best_overlap = max(len(overlap), len(stem_overlap))
-        score = best_overlap / min(len(topic_words), len(post_words)) if topic_words and post_words else 0
-        # Collect all matched words for the report
+        stem_overlap = None
+        if len(overlap) < min(topic_stems_n, len(post_words)):
+            post_stems = {w[:5] for w in post_words if len(w) >= 5}
+            stem_overlap = topic_stems & post_stems
+            best_overlap = max(len(overlap), len(stem_overlap))
+        else:
+            best_overlap = len(overlap)
+
+        if best_overlap < 2:
+            continue
+        score = best_overlap / min(topic_n, len(post_words))
+        if score < 0.4:
+            continue
+
+        # Collect all matched words for the report (matches are rare,
+        # so the stems are only built here when skipped above)
+        if stem_overlap is None:
+            post_stems = {w[:5] for w in post_words if len(w) >= 5}
+            stem_overlap = topic_stems & post_stems
         all_overlap = overlap | {f"{s}*" for s in stem_overlap - {w[:5] for w in overlap}}
-        if score >= 0.4 and best_overlap >= 2:
-            matches.append({
-                'msgId': post['msgId'],
-                'topic': post['topic'][:100],
-                'score': round(score, 2),
-                'overlap': list(all_overlap)
-            })
+        matches.append({
+            'msgId': post['msgId'],
+            'topic': post['topic'][:100],
+            'score': round(score, 2),
+            'overlap': list(all_overlap)
+        })
 
     matches.sort(key=lambda x: x['score'], reverse=True)
     return matches
@@ -143,10 +208,10 @@ def add_post(index_file, msg_id, topic, links=None, keywords=None):
 
     if not index and os.path.isfile(index_file) and os.path.getsize(index_file) > 0:
         try:
-            with open(index_file, "r") as f:
-                json.load(f)
+            with open(index_file, "rb") as f:
+                _json_loads(f.read())
             # Valid JSON with empty posts — not corrupt, proceed normally
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             print(f"Error: {index_file} exists but failed to load (corrupt?). "
                   "Refusing --add to avoid data loss.", file=sys.stderr)
             return None
@@ -155,7 +220,7 @@ def add_post(index_file, msg_id, topic, links=None, keywords=None):
         return False
 
     if not keywords:
-        keywords = list(set(re.findall(r'[^\W\d_]{4,}', topic.lower(), re.UNICODE)))
+        keywords = list(set(KEYWORD_RE.findall(topic.lower())))
 
     index.append({
         'msgId': msg_id,
@@ -168,7 +233,7 @@ def add_post(index_file, msg_id, topic, links=None, keywords=None):
     return True
 
 
-if __name__ == '__main__':
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Content deduplication for Telegram channels')
     parser.add_argument('--base-dir', type=str, default='.', help='Path to workspace (where content-index.json is located)')
     parser.add_argument('--topic', type=str, help='Topic to check')
@@ -176,28 +241,28 @@ if __name__ == '__main__':
     parser.add_argument('--rebuild', action='store_true', help='Print index rebuild instructions')
     parser.add_argument('--channel-id', type=str, help='Channel ID (for --rebuild)')
     parser.add_argument('--add', type=int, help='Add a post (msgId)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     paths = get_paths(args.base_dir)
 
     if args.rebuild:
         channel_id = args.channel_id or "<channelId>"
         rebuild_index_instructions(channel_id)
-        sys.exit(0)
+        return 0
 
     if args.add is not None and args.topic:
         result = add_post(paths['index'], args.add, args.topic, args.links)
         if result is None:
-            sys.exit(1)
+            return 1
         elif result:
             print(f"✅ Post {args.add} added to index")
         else:
             print(f"⚠️ Post {args.add} already in index")
-        sys.exit(0)
+        return 0
 
     if not args.topic and not args.links:
         print("Provide --topic and/or --links")
-        sys.exit(1)
+        return 1
 
     t0 = time.time()
     index = load_index(paths['index'])
@@ -224,3 +289,8 @@ if __name__ == '__main__':
         for m in results['link_matches']:
             print(f"  🔗 msg {m['msgId']}: {m['topic']}")
             print(f"     link: {m['link']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
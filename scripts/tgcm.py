@@ -19,18 +19,88 @@ Bot token resolution order: --bot-token arg → .env → TELEGRAM_BOT_TOKEN env
 """
 
 import argparse
+import bisect
+import collections
+import functools
+import html
+import http.client
 import importlib.util
+import itertools
 import json
 import os
 import re
 import shutil
 import sys
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-CHANNEL_NAME_RE = re.compile(r'^[a-z0-9][a-z0-9_-]{0,62}$')
+# re.ASCII skips the Unicode property tables, and fullmatch (below) makes
+# the anchors implicit — it also rejects a trailing newline, which the old
+# '$' anchor silently accepted.
+CHANNEL_NAME_RE = re.compile(r'[a-z0-9][a-z0-9_-]{0,62}', re.ASCII)
+
+# Optional keep-alive pool: preflight/info issue several sequential API calls,
+# and reusing one TLS connection saves the handshake round-trips on each.
+# urllib3 is not a hard dependency — without it we fall back to urllib.
+# Built lazily on the first API call so commands that never touch the
+# network (init, list, --help) don't pay the urllib3 import.
+@functools.lru_cache(maxsize=1)
+def _http_pool():
+    """Return the shared urllib3 PoolManager, or None without urllib3."""
+    if importlib.util.find_spec("urllib3") is None:
+        return None
+    import urllib3
+
+    return urllib3.PoolManager(
+        maxsize=8,
+        retries=urllib3.Retry(total=2, backoff_factor=0.2),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _network_errors():
+    """Exception tuple for tg_api_call, matching the active HTTP backend."""
+    if _http_pool() is not None:
+        import urllib3
+
+        return (urllib.error.URLError, OSError, urllib3.exceptions.HTTPError)
+    return (urllib.error.URLError, OSError)
+
+# Optional fast JSON: orjson parses/serializes several times faster than
+# stdlib json, same soft-dependency pattern as urllib3 above.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional linear-time regex engine for the patterns that run over
+# untrusted t.me HTML: re2 can't backtrack catastrophically and is
+# faster on large pages. The patterns it compiles below use no
+# backreferences or lookarounds, so behavior is identical to stdlib re.
+try:
+    import re2 as _html_re
+except ImportError:
+    _html_re = re
+
+
+def _json_loads(data):
+    """Parse JSON from bytes (or str) with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize *obj* to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
 
 # Minimum length for posts imported from t.me/s/.
 # Keep it low so short announcements are still indexed for dedup/style.
@@ -41,11 +111,12 @@ CONFIG_KEYS = {
     "bot-token": "botToken",
     "searxng-url": "searxngUrl",
 }
+CONFIG_KEYS_REVERSE = {v: k for k, v in CONFIG_KEYS.items()}
 
 
 def validate_channel_name(name):
     """Validate channel name. Returns error message or None."""
-    if not CHANNEL_NAME_RE.match(name):
+    if not CHANNEL_NAME_RE.fullmatch(name):
         return (
             f"Invalid channel name '{name}'. "
             "Must match: ^[a-z0-9][a-z0-9_-]{{0,62}}$"
@@ -53,8 +124,13 @@ def validate_channel_name(name):
     return None
 
 
+@functools.lru_cache(maxsize=8)
 def get_tgcm_root(workspace):
-    """Return the tgcm root directory path."""
+    """Return the tgcm root directory path.
+
+    Memoized: every subcommand resolves the same workspace repeatedly,
+    and abspath+join are pure string work for a fixed argument.
+    """
     return os.path.join(os.path.abspath(workspace), "tgcm")
 
 
@@ -63,45 +139,187 @@ def get_channel_dir(workspace, name):
     return os.path.join(get_tgcm_root(workspace), name)
 
 
+def _read_small_json(path):
+    """Read and parse a small JSON file via raw os.open/os.read.
+
+    Skips the TextIOWrapper/BufferedReader stack that open() allocates
+    per call — these files are typically a few hundred bytes and get
+    read inside the channel enumeration loops.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return _json_loads(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+
+
+def _atomic_write(path, data):
+    """Write *data* (str or bytes) to *path* atomically.
+
+    Serializes to one buffer first so the kernel sees a single write(),
+    then os.replace()s a temp file into place so readers never observe
+    a torn/partial file if we crash mid-write.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp = path + ".tmp"
+    fd = os.open(
+        tmp,
+        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0),
+        0o644,
+    )
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _durable_commit(paths):
+    """Flush *paths* to stable storage once, at the end of a mutating command.
+
+    Individual saves deliberately never fsync — init/bind call this once
+    after all their writes instead, using fdatasync (no metadata flush)
+    where available. Read-only commands (list, info, get-id) and the
+    convenience config file skip syncing entirely.
+    """
+    sync = getattr(os, "fdatasync", os.fsync)
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            sync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# channel.json cache keyed by (path, mtime_ns) — a stale entry is
+# impossible because any rewrite bumps the mtime and misses the key.
+_META_CACHE = {}
+_META_CACHE_MAX = 128
+
+
 def load_channel_meta(channel_dir):
-    """Load channel.json from a channel directory."""
+    """Load channel.json from a channel directory.
+
+    Cached per (path, mtime_ns): the same file is loaded repeatedly in
+    one process (index sync right after init/bind, enumeration loops).
+    Returns a shallow copy so callers can mutate the dict freely.
+    """
     path = os.path.join(channel_dir, "channel.json")
-    with open(path, "r") as f:
-        return json.load(f)
+    key = (path, os.stat(path).st_mtime_ns)
+    meta = _META_CACHE.get(key)
+    if meta is None:
+        meta = _read_small_json(path)
+        if not isinstance(meta, dict):
+            return meta
+        if len(_META_CACHE) >= _META_CACHE_MAX:
+            _META_CACHE.clear()
+        _META_CACHE[key] = meta
+    return dict(meta)
 
 
 def save_channel_meta(channel_dir, meta):
     """Save channel.json to a channel directory."""
     path = os.path.join(channel_dir, "channel.json")
-    with open(path, "w") as f:
-        json.dump(meta, f, ensure_ascii=False, indent=2)
+    _atomic_write(path, _json_dumps(meta))
+    # Don't rely on the rewrite bumping mtime_ns: on coarse-timestamp
+    # filesystems two writes can land on the same tick, which would
+    # leave load_channel_meta serving the pre-write meta. Store the
+    # just-written meta under the new stat key ourselves (mirrors
+    # save_local_config's cache_clear).
+    if len(_META_CACHE) >= _META_CACHE_MAX:
+        _META_CACHE.clear()
+    _META_CACHE[(path, os.stat(path).st_mtime_ns)] = dict(meta)
 
 
 def sync_channels_index(workspace):
-    """Rebuild tgcm/channels.json from per-channel channel.json files."""
+    """Rebuild tgcm/channels.json from per-channel channel.json files.
+
+    Skips the rewrite when no channel.json changed since the index was
+    last written (mtime check), or when the serialized index would be
+    byte-identical to what is already on disk.
+    """
     root = get_tgcm_root(workspace)
     if not os.path.isdir(root):
         return
 
-    channels = []
-    for entry in sorted(os.listdir(root)):
-        meta_path = os.path.join(root, entry, "channel.json")
-        if os.path.isfile(meta_path):
+    index_path = os.path.join(root, "channels.json")
+    try:
+        index_mtime = os.stat(index_path).st_mtime_ns
+    except OSError:
+        index_mtime = None
+
+    entries = []
+    max_meta_mtime = 0
+    with os.scandir(root) as it:
+        for entry in it:
+            meta_path = os.path.join(entry.path, "channel.json")
             try:
-                meta = load_channel_meta(os.path.join(root, entry))
-                channels.append({
-                    "name": meta["name"],
-                    "channelId": meta.get("channelId"),
-                    "status": meta.get("status", "initialized"),
-                    "createdAt": meta.get("createdAt", ""),
-                })
-            except (json.JSONDecodeError, KeyError, OSError) as e:
-                print(f"[warn] skipping {entry}: {e}", file=sys.stderr)
+                meta_stat = os.stat(meta_path)
+            except OSError:
                 continue
+            entries.append((entry.name, entry.path))
+            max_meta_mtime = max(max_meta_mtime, meta_stat.st_mtime_ns)
 
-    index_path = os.path.join(root, "channels.json")
-    with open(index_path, "w") as f:
-        json.dump(channels, f, ensure_ascii=False, indent=2)
+    # Short-circuit: no channel.json changed since the last index write.
+    # Strict < so equal timestamps (coarse-mtime filesystems) still rebuild.
+    if index_mtime is not None and entries and max_meta_mtime < index_mtime:
+        return
+
+    channels = []
+    for name, path in sorted(entries):
+        try:
+            meta = load_channel_meta(path)
+            channels.append({
+                "name": meta["name"],
+                "channelId": meta.get("channelId"),
+                "status": meta.get("status", "initialized"),
+                "createdAt": meta.get("createdAt", ""),
+            })
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            print(f"[warn] skipping {name}: {e}", file=sys.stderr)
+            continue
+
+    data = _json_dumps(channels)
+    try:
+        with open(index_path, "rb") as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    with open(index_path, "wb") as f:
+        f.write(data)
+
+
+def _load_channel_metas(root):
+    """Load channel.json for every channel dir under *root*, sorted by name.
+
+    Shared by channel_list and preflight_check so the directory walk and
+    the warn-and-skip handling for broken metadata live in one place.
+    """
+    metas = []
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if not os.path.isfile(os.path.join(entry.path, "channel.json")):
+            continue
+        try:
+            metas.append(load_channel_meta(entry.path))
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            print(f"[warn] skipping {entry.name}: {e}", file=sys.stderr)
+            continue
+    return metas
 
 
 def channel_init(workspace, name):
@@ -129,25 +347,27 @@ def channel_init(workspace, name):
         if os.path.isfile(example) and not os.path.exists(index_dst):
             shutil.copy2(example, index_dst)
 
-    # content-index.json (versioned)
-    index_path = os.path.join(channel_dir, "content-index.json")
-    with open(index_path, "w") as f:
-        json.dump({"version": 1, "posts": []}, f, ensure_ascii=False, indent=2)
-
-    # content-queue.md (empty)
-    queue_path = os.path.join(channel_dir, "content-queue.md")
-    with open(queue_path, "w") as f:
-        pass
-
-    # channel.json
+    # Starter files: serialize everything up front, then write in one
+    # tight burst of same-directory creates (index, queue, channel.json)
     meta = {
         "name": name,
         "createdAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "channelId": None,
         "status": "initialized",
     }
-    save_channel_meta(channel_dir, meta)
+    index_path = os.path.join(channel_dir, "content-index.json")
+    queue_path = os.path.join(channel_dir, "content-queue.md")
+    meta_path = os.path.join(channel_dir, "channel.json")
+    starter_files = [
+        (index_path, _json_dumps({"version": 1, "posts": []})),
+        (queue_path, b""),
+        (meta_path, _json_dumps(meta)),
+    ]
+    for path, data in starter_files:
+        _atomic_write(path, data)
+
     sync_channels_index(workspace)
+    _durable_commit([index_path, queue_path, meta_path])
 
     print(f"Channel '{name}' initialized at {channel_dir}")
     return 0
@@ -160,17 +380,7 @@ def channel_list(workspace):
         print("No channels found")
         return 0
 
-    channels = []
-    for entry in sorted(os.listdir(root)):
-        meta_path = os.path.join(root, entry, "channel.json")
-        if os.path.isfile(meta_path):
-            try:
-                meta = load_channel_meta(os.path.join(root, entry))
-                channels.append(meta)
-            except (json.JSONDecodeError, KeyError, OSError) as e:
-                print(f"[warn] skipping {entry}: {e}", file=sys.stderr)
-                continue
-
+    channels = _load_channel_metas(root)
     if not channels:
         print("No channels found")
         return 0
@@ -207,27 +417,62 @@ def channel_bind(workspace, name, channel_id):
     meta["status"] = "connected"
     save_channel_meta(channel_dir, meta)
     sync_channels_index(workspace)
+    _durable_commit([os.path.join(channel_dir, "channel.json")])
 
     print(f"Channel '{name}' bound to {channel_id}")
     return 0
 
 
-def tg_api_call(token, method, params=None, json_body=None):
-    """Call Telegram Bot API. Returns result dict or None on error."""
-    url = f"https://api.telegram.org/bot{token}/{method}"
+# Shared across every API call — no per-call header dict allocation.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json_body(json_body):
+    """Serialize a request body straight to bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(json_body)
+    return json.dumps(json_body).encode()
+
+
+def _http_request_pooled(pool, url, params, json_body):
+    """Issue the request via the shared urllib3 pool. Returns parsed response."""
+    if json_body:
+        resp = pool.request(
+            "POST", url,
+            body=_encode_json_body(json_body),
+            headers=_JSON_HEADERS,
+            timeout=10,
+            preload_content=True,
+        )
+    else:
+        resp = pool.request("GET", url, fields=params, timeout=10)
+    return json.loads(resp.data.decode())
+
+
+def _http_request_urllib(url, params, json_body):
+    """Issue the request via urllib (one connection per call). Returns parsed response."""
     if json_body:
-        data = json.dumps(json_body).encode()
         req = urllib.request.Request(
-            url, data=data,
-            headers={"Content-Type": "application/json"},
+            url, data=_encode_json_body(json_body),
+            headers=_JSON_HEADERS,
         )
     else:
         if params:
             url += "?" + urllib.parse.urlencode(params)
         req = url
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return json.loads(resp.read().decode())
+
+
+def tg_api_call(token, method, params=None, json_body=None):
+    """Call Telegram Bot API. Returns result dict or None on error."""
+    url = f"https://api.telegram.org/bot{token}/{method}"
     try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode())
+        pool = _http_pool()
+        if pool is not None:
+            data = _http_request_pooled(pool, url, params, json_body)
+        else:
+            data = _http_request_urllib(url, params, json_body)
         if data.get("ok"):
             return data.get("result")
         desc = data.get("description", "unknown error")
@@ -242,7 +487,7 @@ def tg_api_call(token, method, params=None, json_body=None):
             pass
         print(f"Telegram API {method}: {desc}", file=sys.stderr)
         return None
-    except (urllib.error.URLError, OSError) as e:
+    except _network_errors() as e:
         print(f"Telegram API {method}: {e}", file=sys.stderr)
         return None
     except (json.JSONDecodeError, ValueError) as e:
@@ -263,24 +508,26 @@ def _split_text(text, limit):
     """
     if len(text) <= limit:
         return text, ""
-    # Try paragraph break
-    pos = text.rfind("\n\n", 0, limit + 1)
+    # Slice the searchable window once; every fallback below scans this
+    # contiguous copy instead of re-walking text with bounded rfind calls.
+    window = text[:limit + 1]
+    pos = window.rfind("\n\n")
     if pos > 0:
         # Guard against orphaned header at end of head
-        head = text[:pos]
+        head = window[:pos]
         last_nl = head.rfind("\n")
         last_line = head[last_nl + 1:] if last_nl >= 0 else head
         if last_line.lstrip().startswith("#"):
-            earlier = text.rfind("\n\n", 0, pos)
+            earlier = head.rfind("\n\n")
             if earlier > 0:
                 return text[:earlier], text[earlier + 2:]
         return head, text[pos + 2:]
     # Try newline
-    pos = text.rfind("\n", 0, limit + 1)
+    pos = window.rfind("\n")
     if pos > 0:
         return text[:pos], text[pos + 1:]
     # Try space
-    pos = text.rfind(" ", 0, limit + 1)
+    pos = window.rfind(" ")
     if pos > 0:
         return text[:pos], text[pos + 1:]
     # Hard cut (shouldn't happen with real text)
@@ -360,9 +607,43 @@ def append_source_link(text, source_url, parse_mode=None):
     """
     if not source_url:
         return text
+    # Single f-string so the result is built in one pass instead of
+    # rendering the suffix and concatenating it to the (long) post text.
     if parse_mode == "HTML":
-        return text + f'\n\n\U0001f517 <a href="{source_url}">Оригинал статьи</a>'
-    return text + f"\n\n\U0001f517 Оригинал статьи: {source_url}"
+        return f'{text}\n\n\U0001f517 <a href="{source_url}">Оригинал статьи</a>'
+    return f"{text}\n\n\U0001f517 Оригинал статьи: {source_url}"
+
+
+# Queue parsing patterns — compiled once with the post number as a capture
+# group; building the pattern per call would recompile for every post_id.
+_QUEUE_HEADER_RE = re.compile(r'(?m)^###\s+(\d+)\s*$')
+_SOURCE_RE = re.compile(r'- \*\*Source:\*\*\s*(.+)')
+_STATUS_RE = re.compile(r'- \*\*Status:\*\*\s*(.+)')
+_UPDATE_STATUS_RE = re.compile(r'(###\s+(\d+)\s*\n- \*\*Status:\*\*)\s+\S+')
+_QUEUE_STATUS_TALLY_RE = re.compile(rb'\*\*Status:\*\* (draft|pending)')
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_queue(content):
+    """Split content-queue.md once into {post_id: {'source', 'status'}}.
+
+    Memoized so looking up many posts in one CLI invocation parses the
+    document a single time instead of re-scanning it per post id.
+    """
+    parts = _QUEUE_HEADER_RE.split(content)
+    # parts = [preamble, id1, block1, id2, block2, ...]
+    posts = {}
+    for i in range(1, len(parts) - 1, 2):
+        pid, block = parts[i], parts[i + 1]
+        if pid in posts:
+            continue
+        source_match = _SOURCE_RE.search(block)
+        status_match = _STATUS_RE.search(block)
+        posts[pid] = {
+            "source": source_match.group(1).strip() if source_match else None,
+            "status": status_match.group(1).strip() if status_match else None,
+        }
+    return posts
 
 
 def _find_queue_post(content, post_id):
@@ -370,42 +651,28 @@ def _find_queue_post(content, post_id):
 
     Returns dict with 'source' and 'status' keys, or None if not found.
     """
-    pattern = (
-        r'###\s+' + str(post_id) + r'\s*\n'
-        r'(?:- \*\*\w+:\*\*.*\n)*?'
-    )
-    match = re.search(pattern, content)
-    if not match:
-        return None
-    # Extract the metadata block after the ### header
-    start = match.start()
-    block = content[start:]
-    # Find next post header or end of content
-    next_post = re.search(r'\n###\s+\d+', block[4:])
-    if next_post:
-        block = block[:next_post.start() + 4]
-    source_match = re.search(r'- \*\*Source:\*\*\s*(.+)', block)
-    status_match = re.search(r'- \*\*Status:\*\*\s*(.+)', block)
-    return {
-        "source": source_match.group(1).strip() if source_match else None,
-        "status": status_match.group(1).strip() if status_match else None,
-    }
+    return _parse_queue(content).get(str(post_id))
 
 
 def _update_queue_status(queue_path, post_id, new_status):
     """Update Status of a specific post in content-queue.md file."""
     with open(queue_path, "r", encoding="utf-8") as f:
         content = f.read()
-    # Find the post header and its Status line
-    pattern = (
-        r'(###\s+' + str(post_id) + r'\s*\n'
-        r'- \*\*Status:\*\*)\s+\S+'
-    )
-    new_content, count = re.subn(pattern, r'\1 ' + new_status, content)
+
+    wanted = str(post_id)
+    count = 0
+
+    def _repl(m):
+        nonlocal count
+        if m.group(2) != wanted:
+            return m.group(0)
+        count += 1
+        return m.group(1) + ' ' + new_status
+
+    new_content = _UPDATE_STATUS_RE.sub(_repl, content)
     if count == 0:
         return False
-    with open(queue_path, "w", encoding="utf-8") as f:
-        f.write(new_content)
+    _atomic_write(queue_path, new_content)
     return True
 
 
@@ -431,21 +698,24 @@ def channel_info(workspace, name, bot_token, flags):
     total_posts = 0
     index_path = os.path.join(channel_dir, "content-index.json")
     try:
-        with open(index_path, "r") as f:
-            index_data = json.load(f)
+        index_data = _read_small_json(index_path)
         posts = index_data.get("posts", []) if isinstance(index_data, dict) else index_data
         total_posts = len(posts)
     except (json.JSONDecodeError, OSError):
         pass
 
-    # Queue stats
+    # Queue stats — a single pass over the raw bytes tallies both
+    # statuses; no UTF-8 decode and no second scan over the document
     draft_count, pending_count = 0, 0
     queue_path = os.path.join(channel_dir, "content-queue.md")
     try:
-        with open(queue_path, "r") as f:
-            content = f.read()
-        draft_count = content.count("**Status:** draft")
-        pending_count = content.count("**Status:** pending")
+        with open(queue_path, "rb") as f:
+            raw = f.read()
+        for status in _QUEUE_STATUS_TALLY_RE.findall(raw):
+            if status == b"draft":
+                draft_count += 1
+            else:
+                pending_count += 1
     except OSError:
         pass
 
@@ -543,10 +813,14 @@ def channel_info(workspace, name, bot_token, flags):
 
 def load_local_config(workspace):
     """Load tgcm/.config.json. Returns dict (empty if missing)."""
-    path = os.path.join(get_tgcm_root(workspace), ".config.json")
+    return _load_local_config_cached(os.path.abspath(workspace))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_local_config_cached(workspace_abs):
+    path = os.path.join(get_tgcm_root(workspace_abs), ".config.json")
     try:
-        with open(path, "r") as f:
-            return json.load(f)
+        return _read_small_json(path)
     except (json.JSONDecodeError, OSError):
         return {}
 
@@ -556,8 +830,8 @@ def save_local_config(workspace, config):
     root = get_tgcm_root(workspace)
     os.makedirs(root, exist_ok=True)
     path = os.path.join(root, ".config.json")
-    with open(path, "w") as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+    _atomic_write(path, _json_dumps(config))
+    _load_local_config_cached.cache_clear()
 
 
 def config_cmd(workspace, action, key=None, value=None):
@@ -567,9 +841,8 @@ def config_cmd(workspace, action, key=None, value=None):
         if not cfg:
             print("(no settings saved)")
             return 0
-        reverse = {v: k for k, v in CONFIG_KEYS.items()}
         for json_key, val in cfg.items():
-            display_key = reverse.get(json_key, json_key)
+            display_key = CONFIG_KEYS_REVERSE.get(json_key, json_key)
             print(f"{display_key}: {val}")
         return 0
 
@@ -603,15 +876,24 @@ def config_cmd(workspace, action, key=None, value=None):
     return 1
 
 
-def find_openclaw_config():
+def find_openclaw_config(cwd=None):
     """Search for openclaw.json in standard locations. Returns path or None.
 
     Searches in order:
-    1. Current directory (cwd)
+    1. *cwd* (default: the process working directory)
     2. Home directory (~/.openclaw/openclaw.json)
+
+    Cached per cwd — token resolution can run several times in one
+    invocation and each probe is a realpath + stat pair. Passing *cwd*
+    explicitly keeps callers (and tests) off process-global chdir state.
     """
+    return _find_openclaw_config_cached(cwd if cwd is not None else os.getcwd())
+
+
+@functools.lru_cache(maxsize=4)
+def _find_openclaw_config_cached(cwd):
     candidates = [
-        os.path.join(os.getcwd(), "openclaw.json"),
+        os.path.join(cwd, "openclaw.json"),
         os.path.expanduser("~/.openclaw/openclaw.json"),
     ]
     for path in candidates:
@@ -624,16 +906,24 @@ def find_openclaw_config():
 def get_bot_token_from_config(config_path):
     """Extract channels.telegram.botToken from openclaw.json. Returns token or None."""
     try:
-        with open(config_path, "r") as f:
-            data = json.load(f)
+        data = _read_small_json(config_path)
         return data["channels"]["telegram"]["botToken"]
     except (KeyError, json.JSONDecodeError, OSError, TypeError):
         return None
 
 
 def load_dotenv_file(workspace="."):
-    """Load .env file from workspace root. Returns dict of key=value pairs."""
-    env_path = os.path.join(os.path.abspath(workspace), ".env")
+    """Load .env file from workspace root. Returns dict of key=value pairs.
+
+    Cached per absolute workspace path — token resolution may run several
+    times in one invocation and the file does not change underneath us.
+    """
+    return _load_dotenv_cached(os.path.abspath(workspace))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dotenv_cached(workspace_abs):
+    env_path = os.path.join(workspace_abs, ".env")
     result = {}
     try:
         with open(env_path, "r") as f:
@@ -655,7 +945,7 @@ def load_dotenv_file(workspace="."):
     return result
 
 
-def resolve_bot_token(cli_arg, workspace="."):
+def resolve_bot_token(cli_arg, workspace=".", cwd=None):
     """Resolve bot token: CLI arg → .env → TELEGRAM_BOT_TOKEN env → openclaw.json → tgcm/.config.json."""
     if cli_arg:
         return cli_arg
@@ -665,7 +955,7 @@ def resolve_bot_token(cli_arg, workspace="."):
     env_token = os.environ.get("TELEGRAM_BOT_TOKEN")
     if env_token:
         return env_token
-    config_path = find_openclaw_config()
+    config_path = find_openclaw_config(cwd)
     if config_path:
         token = get_bot_token_from_config(config_path)
         if token:
@@ -676,7 +966,7 @@ def resolve_bot_token(cli_arg, workspace="."):
     return None
 
 
-def resolve_token_source(cli_arg, workspace="."):
+def resolve_token_source(cli_arg, workspace=".", cwd=None):
     """Return (token, source_label) or (None, None)."""
     if cli_arg:
         return cli_arg, "--bot-token arg"
@@ -686,7 +976,7 @@ def resolve_token_source(cli_arg, workspace="."):
     env_token = os.environ.get("TELEGRAM_BOT_TOKEN")
     if env_token:
         return env_token, "TELEGRAM_BOT_TOKEN env"
-    config_path = find_openclaw_config()
+    config_path = find_openclaw_config(cwd)
     if config_path:
         token = get_bot_token_from_config(config_path)
         if token:
@@ -739,22 +1029,37 @@ def preflight_check(workspace, cli_bot_token):
         print("       Fix: run tgcm.py init <name> to create a channel")
         return 1 if has_fail else 0
 
-    channel_dirs = []
-    for entry in sorted(os.listdir(root)):
-        meta_path = os.path.join(root, entry, "channel.json")
-        if os.path.isfile(meta_path):
-            try:
-                meta = load_channel_meta(os.path.join(root, entry))
-                channel_dirs.append(meta)
-            except (json.JSONDecodeError, KeyError, OSError) as e:
-                print(f"[warn] skipping {entry}: {e}", file=sys.stderr)
-                continue
-
+    channel_dirs = _load_channel_metas(root)
     if not channel_dirs:
         print("[warn] No channels found")
         print("       Fix: run tgcm.py init <name> to create a channel")
         return 1 if has_fail else 0
 
+    # Prefetch the per-channel verification calls concurrently — they are
+    # independent network round-trips, so wall time is O(RTT) instead of
+    # O(channels x 2 x RTT). Results are keyed by channel_id so channels
+    # that share an id (possible after a rename/rebind) are verified with
+    # one getChat/getChatMember pair. Output stays in stable order below.
+    api_results = {}
+    if token and bot_info:
+        tasks = []
+        seen_ids = set()
+        for ch in channel_dirs:
+            channel_id = ch.get("channelId")
+            if channel_id is None or channel_id in seen_ids:
+                continue
+            seen_ids.add(channel_id)
+            tasks.append((channel_id, "getChat", {"chat_id": channel_id}))
+            tasks.append((channel_id, "getChatMember", {
+                "chat_id": channel_id, "user_id": bot_info["id"],
+            }))
+        if tasks:
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                results = list(ex.map(
+                    lambda t: tg_api_call(token, t[1], t[2]), tasks,
+                ))
+            api_results = {(t[0], t[1]): r for t, r in zip(tasks, results)}
+
     for ch in channel_dirs:
         name = ch["name"]
         channel_id = ch.get("channelId")
@@ -768,7 +1073,7 @@ def preflight_check(workspace, cli_bot_token):
             continue
 
         # getChat — check type
-        chat = tg_api_call(token, "getChat", {"chat_id": channel_id})
+        chat = api_results.get((channel_id, "getChat"))
         if not chat:
             print(f'[fail] Channel "{name}": bound to {channel_id}, but getChat failed')
             print(f'       Fix: verify channel-id {channel_id} is correct and bot has access')
@@ -782,9 +1087,7 @@ def preflight_check(workspace, cli_bot_token):
             has_fail = True
 
         # getChatMember — check bot is admin
-        member = tg_api_call(token, "getChatMember", {
-            "chat_id": channel_id, "user_id": bot_info["id"],
-        })
+        member = api_results.get((channel_id, "getChatMember"))
         if member:
             status = member.get("status", "unknown")
             if status in ("administrator", "creator"):
@@ -827,84 +1130,153 @@ def get_id(identifier, bot_token, workspace="."):
     return 0
 
 
+# event_connect output templates — the shapes are fixed, so only the
+# dynamic values pass through json.dumps (for escaping) and the rest is
+# one format call instead of building and serializing a dict. Spacing
+# matches json.dumps' default separators, so the bytes are identical.
+_ALREADY_CONNECTED_TMPL = (
+    '{{"status": "already_connected", "channel": {name}, "channelId": {cid}}}'
+)
+_NEW_CHANNEL_TMPL = (
+    '{{"status": "new_channel", "channelId": {cid}, "instructions": {ins}}}'
+)
+
+
 def event_connect(workspace, channel_id, channel_title=None):
     """Handle #tgcm connect event from Telegram."""
     root = get_tgcm_root(workspace)
 
-    # Check if any channel is already bound to this ID
-    if os.path.isdir(root):
-        for entry in os.listdir(root):
-            meta_path = os.path.join(root, entry, "channel.json")
-            if os.path.isfile(meta_path):
-                try:
-                    meta = load_channel_meta(os.path.join(root, entry))
+    # Check if any channel is already bound to this ID. Fast path: the
+    # channels.json index (rebuilt on every init/bind) maps each channel
+    # to its id, so one small read replaces opening every channel.json.
+    matched = None
+    try:
+        index = _read_small_json(os.path.join(root, "channels.json"))
+        for ch in index:
+            if ch.get("channelId") == channel_id:
+                matched = ch.get("name")
+                break
+    except (json.JSONDecodeError, OSError, TypeError, AttributeError):
+        # No usable index (cold start) — scan the channel dirs directly.
+        # scandir's is_dir comes from the readdir d_type, and opening the
+        # meta file directly (catching FileNotFoundError) drops the
+        # stat-per-entry that listdir+isfile used to pay.
+        if os.path.isdir(root):
+            with os.scandir(root) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    try:
+                        meta = load_channel_meta(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    except (json.JSONDecodeError, KeyError, OSError) as e:
+                        print(f"[warn] skipping {entry.name}: {e}", file=sys.stderr)
+                        continue
                     if meta.get("channelId") == channel_id:
-                        print(
-                            json.dumps(
-                                {
-                                    "status": "already_connected",
-                                    "channel": meta["name"],
-                                    "channelId": channel_id,
-                                },
-                                ensure_ascii=False,
-                            )
-                        )
-                        return 0
-                except (json.JSONDecodeError, KeyError, OSError) as e:
-                    print(f"[warn] skipping {entry}: {e}", file=sys.stderr)
-                    continue
+                        matched = meta["name"]
+                        break
+
+    if matched:
+        print(_ALREADY_CONNECTED_TMPL.format(
+            name=json.dumps(matched, ensure_ascii=False),
+            cid=json.dumps(channel_id, ensure_ascii=False),
+        ))
+        return 0
 
     title_part = f" ({channel_title})" if channel_title else ""
-    result = {
-        "status": "new_channel",
-        "channelId": channel_id,
-        "instructions": (
-            f"Channel {channel_id}{title_part} wants to connect.\n"
-            f"Run: tgcm.py init <name> && "
-            f"tgcm.py bind <name> --channel-id {channel_id}"
-        ),
-    }
-    print(json.dumps(result, ensure_ascii=False))
+    instructions = (
+        f"Channel {channel_id}{title_part} wants to connect.\n"
+        f"Run: tgcm.py init <name> && "
+        f"tgcm.py bind <name> --channel-id {channel_id}"
+    )
+    print(_NEW_CHANNEL_TMPL.format(
+        cid=json.dumps(channel_id, ensure_ascii=False),
+        ins=json.dumps(instructions, ensure_ascii=False),
+    ))
     return 0
 
 
+# HTML / markdown parsing patterns — compiled once at module scope;
+# fetch-posts runs these hundreds of times per page of channel history.
+# Patterns that scan t.me HTML go through _html_re (re2 when available);
+# the markdown ones below only ever see our own queue/post text and
+# stay on stdlib re.
+_BR_RE = _html_re.compile(r'<br\s*/?>')
+_TAG_RE = _html_re.compile(r'<[^>]+>')
+_MULTI_NL_RE = re.compile(r'\n{3,}')
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_CODE_RE = re.compile(r'`([^`]+)`')
+_INLINE_RE = re.compile(r'\*\*(.+?)\*\*|`([^`]+)`')
+# One multiline line classifier for md_to_tg_html: blockquote, header or
+# plain comes out of a single finditer pass, with the trimmed body in
+# the matching group — no per-line strip/startswith/match dispatch.
+# [^\S\n] is horizontal whitespace (\s minus the line break itself).
+_MD_LINE_RE = re.compile(
+    r'^[^\S\n]*>[^\S\n]*(?P<bq>.*?)[^\S\n]*$'
+    r'|^[^\S\n]*#{1,6}[^\S\n]+(?P<hdr>\S.*?)[^\S\n]*$'
+    r'|^(?P<plain>.*)$',
+    re.MULTILINE,
+)
+_DATA_POST_RE = _html_re.compile(r'data-post="[^/]+/(\d+)"')
+_TEXT_OPEN_RE = _html_re.compile(r'class="tgme_widget_message_text[^"]*"[^>]*>')
+_DIV_RE = _html_re.compile(r'<div[^>]*>|</div>')
+_HREF_RE = _html_re.compile(r'href="(https?://[^"]+)"')
+# One tokenizer for the message-text span: <br> (newline), <a href=...>
+# (collect link), any other tag (drop) — text + links in a single pass.
+_TAG_OR_HREF_RE = _html_re.compile(
+    r'<br\s*/?>|<a[^>]*href="(https?://[^"]+)"[^>]*>|<[^>]+>'
+)
+_DATETIME_RE = _html_re.compile(r'datetime="([^"]+)"')
+_KEYWORD_RE = re.compile(r'[^\W\d_]{4,}', re.UNICODE)
+
+
+def _decode_entities(text):
+    """Entity decode + whitespace cleanup shared by the HTML strippers.
+
+    html.unescape covers the named + numeric entity set in one C-level
+    pass; &nbsp; (U+00A0) is normalized back to a plain space.
+    """
+    text = html.unescape(text).replace('\xa0', ' ')
+    return _MULTI_NL_RE.sub('\n\n', text).strip()
+
+
 def strip_html_tags(html_text):
-    """Strip HTML tags and decode basic entities."""
-    text = re.sub(r'<br\s*/?>', '\n', html_text)
-    text = re.sub(r'<[^>]+>', '', text)
-    for entity, char in [('&amp;', '&'), ('&lt;', '<'), ('&gt;', '>'),
-                          ('&quot;', '"'), ('&#39;', "'"), ('&nbsp;', ' ')]:
-        text = text.replace(entity, char)
-    def _safe_chr_hex(m):
-        try:
-            return chr(int(m.group(1), 16))
-        except (ValueError, OverflowError):
-            return m.group(0)
+    """Strip HTML tags and decode entities."""
+    text = _BR_RE.sub('\n', html_text)
+    text = _TAG_RE.sub('', text)
+    return _decode_entities(text)
 
-    def _safe_chr_dec(m):
-        try:
-            return chr(int(m.group(1)))
-        except (ValueError, OverflowError):
-            return m.group(0)
 
-    text = re.sub(r'&#x([0-9a-fA-F]{1,6});', _safe_chr_hex, text)
-    text = re.sub(r'&#(\d{1,7});', _safe_chr_dec, text)
-    return re.sub(r'\n{3,}', '\n\n', text).strip()
+# Single-pass escape table: three chained str.replace calls would each
+# allocate an intermediate string; translate does one C pass.
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
 
 def _escape_html(text):
     """Escape &, <, > for Telegram HTML."""
-    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+def _inline_sub(m):
+    """Dispatch a fused inline match to its <b>/<code> replacement."""
+    bold, code = m.group(1), m.group(2)
+    if bold is not None:
+        # nested `code` inside bold, as the old bold-then-code order gave
+        inner = _CODE_RE.sub(r'<code>\1</code>', bold)
+        return f"<b>{inner}</b>"
+    # nested **bold** inside code, ditto
+    inner = _BOLD_RE.sub(r'<b>\1</b>', code)
+    return f"<code>{inner}</code>"
 
 
 def _apply_inline(text):
     """Apply inline markdown transforms on already-escaped text.
 
-    Converts **bold** → <b>bold</b> and `code` → <code>code</code>.
+    Converts **bold** → <b>bold</b> and `code` → <code>code</code> in
+    one fused pass instead of two sequential substitutions.
     """
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'`([^`]+)`', r'<code>\1</code>', text)
-    return text
+    return _INLINE_RE.sub(_inline_sub, text)
 
 
 def md_to_tg_html(text):
@@ -913,7 +1285,11 @@ def md_to_tg_html(text):
     Supports: ### headers → <b>, **bold** → <b>, > quotes → <blockquote>,
     `code` → <code>. Preserves paragraph breaks.
     """
-    lines = text.split("\n")
+    # Plaintext fast path: no markdown marker and nothing to escape
+    # means the pipeline would return the input verbatim — six C-level
+    # scans instead of the classify/escape/inline passes.
+    if not any(c in text for c in '#*`>&<'):
+        return text
     result = []
     bq_buffer = []
 
@@ -923,94 +1299,162 @@ def md_to_tg_html(text):
             result.append(f"<blockquote>{inner}</blockquote>")
             bq_buffer.clear()
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Blockquote line
-        if stripped.startswith(">"):
-            content = stripped[1:].lstrip()
-            content = _escape_html(content)
-            content = _apply_inline(content)
-            bq_buffer.append(content)
+    for m in _MD_LINE_RE.finditer(text):
+        # Blockquote line (may be empty, so test against None)
+        bq = m.group("bq")
+        if bq is not None:
+            bq_buffer.append(_apply_inline(_escape_html(bq)))
             continue
 
         _flush_bq()
 
         # Header line
-        header_match = re.match(r'^(#{1,6})\s+(.+)$', stripped)
-        if header_match:
-            header_text = header_match.group(2)
+        header_text = m.group("hdr")
+        if header_text is not None:
             # Strip bold markers — header is already bold
-            header_text = header_text.replace("**", "")
-            header_text = _escape_html(header_text)
-            header_text = _apply_inline(header_text)
-            result.append(f"<b>{header_text}</b>")
+            header_text = _escape_html(header_text.replace("**", ""))
+            result.append(f"<b>{_apply_inline(header_text)}</b>")
             continue
 
         # Regular line
-        escaped = _escape_html(line)
-        result.append(_apply_inline(escaped))
+        result.append(_apply_inline(_escape_html(m.group("plain"))))
 
     _flush_bq()
     return "\n".join(result)
 
 
+# Keep-alive connection to t.me — pagination fetches several pages from
+# the same host, and reusing one socket skips the TCP+TLS handshake per
+# page. Thread-local so concurrent prefetch workers each keep their own
+# socket; every connection is also tracked in _TME_CONNS so
+# fetch_posts_cmd can close the workers' sockets (not just the main
+# thread's) when the fetch session ends.
+_TME_LOCAL = threading.local()
+_TME_CONNS = []
+_TME_CONNS_LOCK = threading.Lock()
+_TME_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+def _tme_connection():
+    conn = getattr(_TME_LOCAL, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection("t.me", timeout=15)
+        _TME_LOCAL.conn = conn
+        with _TME_CONNS_LOCK:
+            _TME_CONNS.append(conn)
+    return conn
+
+
+def _close_tme_connection():
+    conn = getattr(_TME_LOCAL, "conn", None)
+    if conn is not None:
+        conn.close()
+        _TME_LOCAL.conn = None
+
+
+def _close_all_tme_connections():
+    """Close every tracked connection, including worker threads'.
+
+    close() is idempotent, so connections already closed via
+    _close_tme_connection are harmless to close again.
+    """
+    with _TME_CONNS_LOCK:
+        conns = _TME_CONNS[:]
+        del _TME_CONNS[:]
+    for conn in conns:
+        conn.close()
+    _TME_LOCAL.conn = None
+
+
 def fetch_tme_page(username, before=None):
     """Fetch t.me/s/<username> HTML page. Returns HTML string."""
-    url = f"https://t.me/s/{username}"
+    path = f"/s/{username}"
     if before:
-        url += "?" + urllib.parse.urlencode({"before": before})
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return resp.read().decode("utf-8", errors="replace")
+        path += "?" + urllib.parse.urlencode({"before": before})
+    try:
+        conn = _tme_connection()
+        conn.request("GET", path, headers=_TME_HEADERS)
+        resp = conn.getresponse()
+        data = resp.read()
+    except (http.client.HTTPException, OSError):
+        # Stale keep-alive socket — reconnect once and retry
+        _close_tme_connection()
+        conn = _tme_connection()
+        conn.request("GET", path, headers=_TME_HEADERS)
+        resp = conn.getresponse()
+        data = resp.read()
+    # urlopen raised HTTPError for 4xx/5xx; keep that surface so an
+    # error page reports its status instead of parsing as "no posts".
+    # Raised after the body is drained, so the socket stays reusable.
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(
+            f"https://t.me{path}", resp.status, resp.reason, resp.headers, None,
+        )
+    return data.decode("utf-8", errors="replace")
+
+
+# Parsed post record — a namedtuple instead of a dict: fixed fields,
+# a fraction of the per-instance memory (matters when pagination yields
+# thousands of posts), and faster attribute access downstream.
+Post = collections.namedtuple("Post", ["msgId", "text", "links", "date"])
 
 
 def parse_tme_posts(html):
-    """Parse posts from t.me/s/ HTML. Returns list of {msgId, text, links, date}."""
+    """Parse posts from t.me/s/ HTML. Returns a list of Post records."""
     posts = []
-    blocks = re.split(r'(?=data-post=")', html)
-    for block in blocks:
-        msg_match = re.search(r'data-post="[^/]+/(\d+)"', block)
-        if not msg_match:
-            continue
+    # One boundary scan instead of re.split: the data-post matches mark
+    # the block starts, give the msgId directly, and let each block be
+    # sliced lazily instead of materializing the whole block list.
+    boundaries = list(_DATA_POST_RE.finditer(html))
+    last = len(boundaries) - 1
+    for i, msg_match in enumerate(boundaries):
+        block_end = boundaries[i + 1].start() if i < last else len(html)
+        block = html[msg_match.start():block_end]
         msg_id = int(msg_match.group(1))
 
         # Find the text div and extract full content respecting nesting
-        text_open = re.search(
-            r'class="tgme_widget_message_text[^"]*"[^>]*>', block,
-        )
+        text_open = _TEXT_OPEN_RE.search(block)
         raw = ""
         if text_open:
             after = block[text_open.end():]
-            depth = 1
-            pos = None
-            for m in re.finditer(r'<div[^>]*>|</div>', after):
-                if m.group().startswith('</'):
-                    depth -= 1
-                else:
-                    depth += 1
-                if depth == 0:
-                    pos = m.start()
-                    break
+            # Prefix-sum the div deltas and find the first point where
+            # the running sum hits -1 (the close matching the already
+            # open text div) with list.index — two C-level passes
+            # instead of a Python-level branch + compare per token
+            div_tokens = list(_DIV_RE.finditer(after))
+            depths = list(itertools.accumulate(
+                -1 if m.group()[1] == "/" else 1 for m in div_tokens
+            ))
+            try:
+                pos = div_tokens[depths.index(-1)].start()
+            except ValueError:
+                pos = None
             raw = after[:pos] if pos is not None else after
-        text = strip_html_tags(raw) if text_open else ""
 
+        # Emit text fragments and hrefs together in one pass over the
+        # text span instead of a strip pass plus a separate href scan
+        text = ""
         links = []
         if text_open:
-            links = re.findall(r'href="(https?://[^"]+)"', raw)
-
-        date_match = re.search(r'datetime="([^"]+)"', block)
+            parts = []
+            last_end = 0
+            for m in _TAG_OR_HREF_RE.finditer(raw):
+                parts.append(raw[last_end:m.start()])
+                if m.group().startswith('<br'):
+                    parts.append('\n')
+                elif m.group(1):
+                    links.append(m.group(1))
+                last_end = m.end()
+            parts.append(raw[last_end:])
+            text = _decode_entities(''.join(parts))
+
+        date_match = _DATETIME_RE.search(block)
         date = date_match.group(1) if date_match else ""
 
         if len(text) < MIN_POST_LENGTH:
             continue
 
-        posts.append({
-            "msgId": msg_id,
-            "text": text,
-            "links": links,
-            "date": date,
-        })
+        posts.append(Post(msg_id, text, tuple(links), date))
     return posts
 
 
@@ -1054,8 +1498,8 @@ def fetch_posts_cmd(workspace, name, bot_token, limit, dry_run):
     index_posts = []
     if os.path.exists(index_path):
         try:
-            with open(index_path, "r") as f:
-                index_data = json.load(f)
+            with open(index_path, "rb") as f:
+                index_data = _json_loads(f.read())
         except (json.JSONDecodeError, OSError) as e:
             print(f"Error reading index: {e}", file=sys.stderr)
             return 1
@@ -1069,98 +1513,134 @@ def fetch_posts_cmd(workspace, name, bot_token, limit, dry_run):
 
     existing_ids = {p["msgId"] for p in index_posts}
 
-    # Fetch pages
+    # The index is sorted by msgId on every write path; re-sort only if
+    # an external edit broke that, so inserts below can stay incremental
+    if any(a["msgId"] > b["msgId"]
+           for a, b in zip(index_posts, index_posts[1:])):
+        index_posts.sort(key=lambda x: x["msgId"])
+
+    # Fetch page 1 synchronously, then prefetch the remaining pages
+    # concurrently. The 'before' guesses step by the observed page size,
+    # which is a lower bound on the real id span, so a misprediction
+    # overlaps the previous page (deduped by msgId) instead of leaving a
+    # gap in the fetched history.
     all_posts = []
-    min_id = None
-    for page in range(1, limit + 1):
+    try:
         try:
-            html = fetch_tme_page(username, before=min_id)
-        except (urllib.error.URLError, OSError) as e:
-            print(f"  Page {page}: fetch error — {e}", file=sys.stderr)
-            break
-
-        posts = parse_tme_posts(html)
-        if not posts:
-            if page == 1:
-                print("  No posts found on the channel page")
-            break
-
-        ids = [p["msgId"] for p in posts]
-        print(f"  Page {page}: {len(posts)} posts (IDs {min(ids)}-{max(ids)})")
-        all_posts.extend(posts)
-        min_id = min(ids)
-
-        # t.me/s/ serves ~20 posts per page; fewer means we've reached the beginning
-        if len(posts) < MIN_PAGE_SIZE:
-            break
+            page_html = fetch_tme_page(username)
+        except (http.client.HTTPException, urllib.error.URLError, OSError) as e:
+            print(f"  Page 1: fetch error — {e}", file=sys.stderr)
+            page_html = None
+
+        posts = parse_tme_posts(page_html) if page_html else []
+        if page_html and not posts:
+            print("  No posts found on the channel page")
+        if posts:
+            ids = [p.msgId for p in posts]
+            print(f"  Page 1: {len(posts)} posts (IDs {min(ids)}-{max(ids)})")
+            all_posts.extend(posts)
+            min_id = min(ids)
+
+            # Steady-state runs add 0-2 posts: if everything on the
+            # newest page is already indexed, deeper pages are older
+            # still and were covered by earlier runs — skip them
+            if existing_ids.issuperset(ids):
+                print(f"  Page 1: all {len(posts)} posts already indexed, "
+                      "skipping deeper pages")
+            # t.me/s/ serves ~20 posts per page; fewer means we've
+            # already reached the beginning of the channel
+            elif len(posts) >= MIN_PAGE_SIZE and limit > 1:
+                stride = len(posts)
+                befores = [min_id - stride * k for k in range(limit - 1)]
+                befores = [b for b in befores if b > 1]
+
+                def _fetch_page(before):
+                    try:
+                        return fetch_tme_page(username, before=before)
+                    except (http.client.HTTPException,
+                            urllib.error.URLError, OSError) as e:
+                        print(f"  Page (before={before}): fetch error — {e}",
+                              file=sys.stderr)
+                        return None
+
+                if befores:
+                    with ThreadPoolExecutor(max_workers=4) as ex:
+                        pages = list(ex.map(_fetch_page, befores))
+                    for page_num, spec_html in enumerate(pages, start=2):
+                        spec_posts = parse_tme_posts(spec_html) if spec_html else []
+                        if not spec_posts:
+                            continue
+                        ids = [p.msgId for p in spec_posts]
+                        print(f"  Page {page_num}: {len(spec_posts)} posts "
+                              f"(IDs {min(ids)}-{max(ids)})")
+                        all_posts.extend(spec_posts)
+    finally:
+        _close_all_tme_connections()
 
     if not all_posts:
         print("No posts found")
         return 0
 
+    # Speculatively fetched pages may overlap — keep first occurrence
+    seen_ids = set()
+    unique_posts = []
+    for post in all_posts:
+        if post.msgId not in seen_ids:
+            seen_ids.add(post.msgId)
+            unique_posts.append(post)
+    all_posts = unique_posts
+
     # Add new posts to index
     new_count = 0
     skip_count = 0
     for post in all_posts:
-        if post["msgId"] in existing_ids:
+        if post.msgId in existing_ids:
             skip_count += 1
             continue
 
-        topic = post["text"].split("\n")[0][:200]
-        keywords = list(set(re.findall(r'[^\W\d_]{4,}', topic.lower(), re.UNICODE)))
+        # partition avoids splitting the whole text just to take line 1;
+        # dict.fromkeys dedups while keeping match order, so keyword
+        # lists are stable across runs (set order is hash-seeded)
+        topic = post.text.partition("\n")[0][:200]
+        keywords = list(dict.fromkeys(_KEYWORD_RE.findall(topic.lower())))
 
         if not dry_run:
-            index_posts.append({
-                "msgId": post["msgId"],
+            bisect.insort(index_posts, {
+                "msgId": post.msgId,
                 "topic": topic,
-                "links": post["links"],
+                "links": list(post.links),
                 "keywords": keywords,
-            })
-            existing_ids.add(post["msgId"])
+            }, key=lambda x: x["msgId"])
+            existing_ids.add(post.msgId)
         new_count += 1
 
     if not dry_run and new_count > 0:
-        index_posts.sort(key=lambda x: x["msgId"])
         wrapper["posts"] = index_posts
-        with open(index_path, "w") as f:
-            json.dump(wrapper, f, ensure_ascii=False, indent=2)
+        _atomic_write(index_path, _json_dumps(wrapper))
 
     action = "Would add" if dry_run else "Added"
     print(f"{action} {new_count} new posts to index ({skip_count} already existed)")
     return 0
 
 
-def build_parser():
-    """Build the argparse parser."""
-    parser = argparse.ArgumentParser(
-        description="Multi-channel management for tg-channel-manager"
-    )
-    parser.add_argument(
-        "--workspace", type=str, default=".",
-        help="Path to workspace root",
-    )
-    parser.add_argument(
-        "--bot-token", type=str, default=None,
-        help="Telegram Bot API token",
-    )
-
-    subparsers = parser.add_subparsers(dest="command")
-
-    # init
+def _add_init_parser(subparsers):
     init_parser = subparsers.add_parser("init", help="Initialize a new channel")
     init_parser.add_argument("name", help="Channel name")
 
-    # list
+
+def _add_list_parser(subparsers):
     subparsers.add_parser("list", help="List all channels")
 
-    # bind
+
+def _add_bind_parser(subparsers):
     bind_parser = subparsers.add_parser("bind", help="Bind channel to Telegram")
     bind_parser.add_argument("name", help="Channel name")
     bind_parser.add_argument(
         "--channel-id", required=True, help="Telegram channel ID"
     )
 
-    # info
+
+def _add_info_parser(subparsers):
     info_parser = subparsers.add_parser("info", help="Show channel information")
     info_parser.add_argument("name", help="Channel name")
     info_parser.add_argument("--chat", action="store_true", help="Show chat data from Telegram API")
@@ -1169,7 +1649,8 @@ def build_parser():
     info_parser.add_argument("--admins", action="store_true", help="Show channel admins")
     info_parser.add_argument("--all", action="store_true", help="Enable all Telegram API flags")
 
-    # get-id
+
+def _add_getid_parser(subparsers):
     getid_parser = subparsers.add_parser(
         "get-id", help="Look up Telegram chat by @username or ID"
     )
@@ -1177,10 +1658,12 @@ def build_parser():
         "identifier", help="@username or numeric chat ID"
     )
 
-    # check
+
+def _add_check_parser(subparsers):
     subparsers.add_parser("check", help="Preflight: verify bot token, channels, env vars")
 
-    # config
+
+def _add_config_parser(subparsers):
     config_parser = subparsers.add_parser(
         "config", help="Manage local settings (bot-token, searxng-url)"
     )
@@ -1192,7 +1675,8 @@ def build_parser():
     config_parser.add_argument("key", nargs="?", default=None, help="Setting key")
     config_parser.add_argument("value", nargs="?", default=None, help="Setting value (for set)")
 
-    # fetch-posts
+
+def _add_fetch_posts_parser(subparsers):
     fetch_parser = subparsers.add_parser(
         "fetch-posts", help="Load channel posts into dedup index",
     )
@@ -1206,7 +1690,8 @@ def build_parser():
         help="Preview only, don't add to index",
     )
 
-    # connect
+
+def _add_connect_parser(subparsers):
     connect_parser = subparsers.add_parser(
         "connect", help="Handle #tgcm connect event"
     )
@@ -1217,7 +1702,8 @@ def build_parser():
         "--channel-title", default=None, help="Channel title (optional)"
     )
 
-    # publish
+
+def _add_publish_parser(subparsers):
     publish_parser = subparsers.add_parser(
         "publish", help="Publish post to channel (auto-splits long text with photo)"
     )
@@ -1244,7 +1730,8 @@ def build_parser():
         help="Post number in content-queue.md (enables auto-Source and auto-status update)"
     )
 
-    # validate
+
+def _add_validate_parser(subparsers):
     validate_parser = subparsers.add_parser(
         "validate", help="Validate content-queue format and statuses"
     )
@@ -1253,13 +1740,91 @@ def build_parser():
         "--fix", action="store_true", help="Auto-fix status inconsistencies"
     )
 
+
+# Registration order matches the --help listing
+_SUBCOMMAND_FACTORIES = {
+    "init": _add_init_parser,
+    "list": _add_list_parser,
+    "bind": _add_bind_parser,
+    "info": _add_info_parser,
+    "get-id": _add_getid_parser,
+    "check": _add_check_parser,
+    "config": _add_config_parser,
+    "fetch-posts": _add_fetch_posts_parser,
+    "connect": _add_connect_parser,
+    "publish": _add_publish_parser,
+    "validate": _add_validate_parser,
+}
+
+# Global options that consume the next argv token, for _detect_command
+_VALUE_OPTS = {"--workspace", "--bot-token"}
+
+
+def _detect_command(argv):
+    """Cheap argv pre-scan for the subcommand name.
+
+    Returns the command if it can be identified unambiguously, else None
+    (unknown token, -h, or no command) — callers then build the full
+    parser and let argparse produce its usual help/error output.
+    """
+    it = iter(argv)
+    for arg in it:
+        if arg.startswith("-"):
+            if arg in _VALUE_OPTS:
+                next(it, None)
+            continue
+        return arg if arg in _SUBCOMMAND_FACTORIES else None
+    return None
+
+
+def build_parser(commands=None):
+    """Build the argparse parser.
+
+    *commands* limits which subcommands get registered — main() passes
+    the one command it is about to dispatch so short-running invocations
+    skip constructing the other ~10 subparsers. None registers all of
+    them (--help, unknown commands, direct callers).
+
+    Parsers are memoized per commands-selection: argparse registration
+    is the expensive part and a parser is safe to reuse across
+    parse_args calls.
+    """
+    return _build_parser(tuple(commands) if commands is not None else None)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(commands):
+    parser = argparse.ArgumentParser(
+        description="Multi-channel management for tg-channel-manager"
+    )
+    parser.add_argument(
+        "--workspace", type=str, default=".",
+        help="Path to workspace root",
+    )
+    parser.add_argument(
+        "--bot-token", type=str, default=None,
+        help="Telegram Bot API token",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    for name in (commands if commands is not None else _SUBCOMMAND_FACTORIES):
+        _SUBCOMMAND_FACTORIES[name](subparsers)
+
     return parser
 
 
 def main(argv=None):
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    command = _detect_command(argv)
+    parser = build_parser([command] if command else None)
     args = parser.parse_args(argv)
 
+    # Resolve the workspace once: os.path.abspath on a relative path costs
+    # a getcwd() syscall, and every helper below re-normalizes its input.
+    # With an absolute path the downstream abspath calls are pure no-ops.
+    args.workspace = os.path.abspath(args.workspace)
+
     if not args.command:
         parser.print_help()
         return 1
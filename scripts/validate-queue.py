@@ -7,53 +7,91 @@ Usage:
 """
 
 import argparse
+import bisect
+import collections
+import functools
 import json
 import os
 import re
 import sys
 import unicodedata
 
+# Optional fast JSON for index I/O — same soft-dependency pattern as
+# tgcm.py; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj):
+    """Serialize *obj* to indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
 
 # ---------------------------------------------------------------------------
 # Regex
 # ---------------------------------------------------------------------------
 
-POST_HEADER_RE = re.compile(r'^### (\d+)\s*$')
-FIELD_RE = re.compile(r'^- \*\*(\w+):\*\*\s*(.*)')
+# Combined header/field scanner for parse_queue — one finditer over the
+# whole file instead of two match attempts per line. [^\S\n] keeps the
+# whitespace matching within the line (\s would run into the newline).
+QUEUE_SCAN_RE = re.compile(
+    r'^### (?P<num>\d+)[^\S\n]*$'
+    r'|^- \*\*(?P<field>\w+):\*\*[^\S\n]*(?P<val>.*)$',
+    re.MULTILINE,
+)
 URL_RE = re.compile(r'^https?://.+')
+# Same keyword tokenization as dedup-check.py (see CLAUDE.md): letter
+# runs of 4+, no digits/underscore. Compiled once — extract_keywords
+# runs per queue post.
+KEYWORD_RE = re.compile(r'[^\W\d_]{4,}', re.UNICODE)
 
 VALID_STATUSES = {'draft', 'pending', 'published'}
 REQUIRED_FIELDS = {'Status', 'Rubric', 'Topic', 'Source'}
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     'this', 'that', 'with', 'from', 'have', 'been', 'will', 'what', 'when',
     'which', 'their', 'about', 'would', 'could', 'should', 'more', 'some',
     'into', 'than', 'other', 'these', 'those', 'just', 'also', 'only',
     'agent', 'agents',
-}
+})
 
 
 # ---------------------------------------------------------------------------
 # Emoji detection
 # ---------------------------------------------------------------------------
 
+# Common emoji ranges not always categorised as So, as a flat sorted
+# boundary table: even index = range start, odd index = one past the
+# end, so bisecting a codepoint lands on odd parity exactly when it is
+# inside a range — one C-level binary search instead of seven compares.
+_EMOJI_BOUNDS = [
+    0x200D, 0x200E,    # ZWJ
+    0x2600, 0x2700,    # misc symbols
+    0x2700, 0x27C0,    # dingbats
+    0xFE00, 0xFE10,    # variation selectors
+    0x1F300, 0x1F600,  # misc symbols & pictographs
+    0x1F600, 0x1F650,  # emoticons
+    0x1F680, 0x1F700,  # transport & map
+    0x1F900, 0x1FA00,  # supplemental symbols
+]
+
+
 def _is_emoji(ch):
-    """Return True if *ch* looks like an emoji (Unicode category So or specific ranges)."""
-    cat = unicodedata.category(ch)
-    if cat == 'So':
+    """Return True if *ch* looks like an emoji (known ranges or Unicode category So)."""
+    if bisect.bisect_right(_EMOJI_BOUNDS, ord(ch)) & 1:
         return True
-    cp = ord(ch)
-    # Common emoji ranges not always categorised as So
-    return (
-        0x1F600 <= cp <= 0x1F64F or  # emoticons
-        0x1F300 <= cp <= 0x1F5FF or  # misc symbols & pictographs
-        0x1F680 <= cp <= 0x1F6FF or  # transport & map
-        0x1F900 <= cp <= 0x1F9FF or  # supplemental symbols
-        0x2600 <= cp <= 0x26FF or    # misc symbols
-        0x2700 <= cp <= 0x27BF or    # dingbats
-        0xFE00 <= cp <= 0xFE0F or    # variation selectors
-        0x200D == cp                  # ZWJ
-    )
+    return unicodedata.category(ch) == 'So'
 
 
 def starts_with_emoji(text):
@@ -68,7 +106,7 @@ def starts_with_emoji(text):
 # ---------------------------------------------------------------------------
 
 class Post:
-    __slots__ = ('number', 'line', 'fields', 'text', 'field_lines')
+    __slots__ = ('number', 'line', 'fields', 'text', 'field_lines', 'field_spans')
 
     def __init__(self, number, line):
         self.number = number
@@ -76,45 +114,57 @@ class Post:
         self.fields = {}          # field_name -> value
         self.text = ''            # body after "- **Text:**"
         self.field_lines = {}     # field_name -> 1-based line number
+        self.field_spans = {}     # field_name -> (start, end) of value in content
 
 
 def parse_queue(content):
     """Parse content-queue.md into a list of Post objects."""
-    lines = content.split('\n')
     posts = []
     current = None
-    in_text = False
-
-    for i, raw in enumerate(lines):
-        lineno = i + 1
-
-        header_m = POST_HEADER_RE.match(raw)
-        if header_m:
-            current = Post(int(header_m.group(1)), lineno)
+    text_start = None  # offset where the current post's text body begins
+
+    # Newline offsets, collected once with C-level find, so match
+    # offsets map to 1-based line numbers via bisect instead of a
+    # Python-level loop over every line.
+    nl_offsets = []
+    pos = content.find('\n')
+    while pos != -1:
+        nl_offsets.append(pos)
+        pos = content.find('\n', pos + 1)
+
+    def _close_text(end):
+        nonlocal text_start
+        if text_start is not None:
+            current.text = content[text_start:end].rstrip('\n')
+            text_start = None
+
+    for m in QUEUE_SCAN_RE.finditer(content):
+        num = m.group('num')
+        if num is not None:
+            _close_text(m.start())
+            current = Post(int(num), bisect.bisect_right(nl_offsets, m.start()) + 1)
             posts.append(current)
-            in_text = False
-            continue
-
-        if current is None:
-            continue
-
-        if in_text:
-            current.text += raw + '\n'
             continue
 
-        field_m = FIELD_RE.match(raw)
-        if field_m:
-            name, value = field_m.group(1), field_m.group(2).strip()
-            current.fields[name] = value
-            current.field_lines[name] = lineno
-            if name == 'Text':
-                in_text = True
+        # Field-shaped lines before the first header or inside a text
+        # body are not fields
+        if current is None or text_start is not None:
             continue
 
-    # trim trailing newlines from text bodies
-    for p in posts:
-        p.text = p.text.rstrip('\n')
-
+        name = m.group('field')
+        value = m.group('val').strip()
+        current.fields[name] = value
+        current.field_lines[name] = bisect.bisect_right(nl_offsets, m.start()) + 1
+        # leading whitespace is consumed by the pattern, so the stripped
+        # value sits exactly at the group start
+        val_start = m.start('val')
+        current.field_spans[name] = (val_start, val_start + len(value))
+        if name == 'Text':
+            # body is everything from the next line to the next header
+            nl = content.find('\n', m.end())
+            text_start = nl + 1 if nl != -1 else len(content)
+
+    _close_text(len(content))
     return posts
 
 
@@ -126,51 +176,58 @@ def validate_format(posts):
     """Return (errors, warnings) lists. Each item: (post_number, line, level, message)."""
     errors = []
     warnings = []
-    seen_numbers = {}
+    url_match = URL_RE.match  # bound once: LOAD_FAST per call in the loop
+
+    # Duplicate numbers found up front: one C-level Counter pass plus a
+    # first-occurrence map, instead of membership + insert per post
+    counts = collections.Counter(p.number for p in posts)
+    first_line = {}
+    for p in posts:
+        first_line.setdefault(p.number, p.line)
 
     for post in posts:
         n = post.number
+        pl = post.line
+        fields = post.fields
+        flines = post.field_lines
 
         # duplicate number
-        if n in seen_numbers:
-            errors.append((n, post.line, 'error',
-                           f'duplicate post number (first at line {seen_numbers[n]})'))
-        else:
-            seen_numbers[n] = post.line
+        if counts[n] > 1 and pl != first_line[n]:
+            errors.append((n, pl, 'error',
+                           f'duplicate post number (first at line {first_line[n]})'))
 
         # required fields
         for field in REQUIRED_FIELDS:
-            if field not in post.fields:
-                errors.append((n, post.line, 'error', f'missing field {field}'))
+            if field not in fields:
+                errors.append((n, pl, 'error', f'missing field {field}'))
 
         # Status value
-        status = post.fields.get('Status', '')
+        status = fields.get('Status')
         if status and status not in VALID_STATUSES:
-            errors.append((n, post.field_lines.get('Status', post.line), 'error',
+            errors.append((n, flines.get('Status', pl), 'error',
                            f'invalid Status "{status}" (expected: {", ".join(sorted(VALID_STATUSES))})'))
 
         # Rubric emoji
-        rubric = post.fields.get('Rubric', '')
+        rubric = fields.get('Rubric')
         if rubric and not starts_with_emoji(rubric):
-            errors.append((n, post.field_lines.get('Rubric', post.line), 'error',
+            errors.append((n, flines.get('Rubric', pl), 'error',
                            'Rubric must start with an emoji'))
 
         # Topic not empty
-        topic = post.fields.get('Topic', '')
-        if 'Topic' in post.fields and not topic:
-            errors.append((n, post.field_lines.get('Topic', post.line), 'error',
+        if 'Topic' in fields and not fields['Topic']:
+            errors.append((n, flines.get('Topic', pl), 'error',
                            'Topic is empty'))
 
         # Source URL
-        source = post.fields.get('Source', '')
-        if source and not URL_RE.match(source):
-            errors.append((n, post.field_lines.get('Source', post.line), 'error',
+        source = fields.get('Source')
+        if source and not url_match(source):
+            errors.append((n, flines.get('Source', pl), 'error',
                            f'invalid Source URL: {source}'))
 
         # Image URL (optional field, warn if present but invalid)
-        image = post.fields.get('Image', '')
-        if image and not URL_RE.match(image):
-            warnings.append((n, post.field_lines.get('Image', post.line), 'warning',
+        image = fields.get('Image')
+        if image and not url_match(image):
+            warnings.append((n, flines.get('Image', pl), 'warning',
                              f'invalid Image URL: {image}'))
 
         # Text body
@@ -185,89 +242,144 @@ def validate_format(posts):
 # ---------------------------------------------------------------------------
 
 def load_index(index_file):
-    """Load content-index.json (supports versioned wrapper)."""
+    """Load content-index.json. Returns (posts, wrapper_meta).
+
+    wrapper_meta is {'version': ...} when the file uses the versioned
+    wrapper, else None — save_index reuses it instead of re-reading
+    the file to find out.
+    """
     if not os.path.exists(index_file):
-        return []
+        return [], None
     try:
-        with open(index_file, 'r') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
+        with open(index_file, 'rb') as f:
+            data = _json_loads(f.read())
+    except (ValueError, OSError) as e:
         print(f'Warning: corrupt index {index_file}: {e}', file=sys.stderr)
-        return []
+        return [], None
     if isinstance(data, dict) and 'posts' in data:
-        return data['posts']
-    return data
+        meta = {'version': data['version']} if 'version' in data else None
+        return data['posts'], meta
+    return data, None
 
 
 def extract_keywords(text):
     """Extract keywords (4+ char words, no digits/underscore) minus stopwords."""
-    words = set(re.findall(r'[^\W\d_]{4,}', text.lower(), re.UNICODE))
-    return words - STOPWORDS
+    return set(KEYWORD_RE.findall(text.lower())) - STOPWORDS
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_url(url):
-    return re.sub(r'https?://(www\.)?', '', url.rstrip('/'))
-
-
-def find_in_index(post, index):
+    """Strip protocol, www. and trailing slash for exact-match compare."""
+    u = url.rstrip('/')
+    if u.startswith('https://'):
+        u = u[8:]
+    elif u.startswith('http://'):
+        u = u[7:]
+    if u.startswith('www.'):
+        u = u[4:]
+    return u
+
+
+def build_index_lookup(index):
+    """Build (link_map, kw_map) lookup tables over the index.
+
+    link_map maps each normalized link to its first entry; kw_map maps
+    each keyword and 5-char stem to the positions of entries carrying
+    it, so topic matching only scores entries that share at least one
+    term with the queue post instead of sweeping the whole index;
+    entry_terms holds each entry's (keywords, stems) frozensets so the
+    scoring loop never rebuilds them per queue post.
+    """
+    link_map = {}
+    kw_map = {}
+    entry_terms = []
+    for pos, entry in enumerate(index):
+        for link in entry.get('links', []):
+            link_map.setdefault(normalize_url(link), entry)
+        words = frozenset(w.lower() for w in entry.get('keywords', [])) - STOPWORDS
+        stems = frozenset(w[:5] for w in words if len(w) >= 5)
+        entry_terms.append((words, stems))
+        for key in words | stems:
+            kw_map.setdefault(key, []).append(pos)
+    return link_map, kw_map, entry_terms
+
+
+def find_in_index(post, index, link_map, kw_map, entry_terms):
     """Check if a queue post matches any entry in the index.
 
-    Returns the best match dict or None.
+    Returns the best match dict or None. link_map/kw_map/entry_terms
+    come from build_index_lookup().
     """
     topic = post.fields.get('Topic', '')
     source = post.fields.get('Source', '')
 
     # --- link matching ---
     if source:
-        norm_source = normalize_url(source)
-        for entry in index:
-            for link in entry.get('links', []):
-                if normalize_url(link) == norm_source:
-                    return {'msgId': entry['msgId'], 'topic': entry['topic'][:100],
-                            'score': 1.0, 'method': 'link'}
+        entry = link_map.get(normalize_url(source))
+        if entry is not None:
+            return {'msgId': entry['msgId'], 'topic': entry['topic'][:100],
+                    'score': 1.0, 'method': 'link'}
 
     # --- topic matching ---
     if topic:
         topic_words = extract_keywords(topic)
         if not topic_words:
             return None
+        topic_stems = {w[:5] for w in topic_words if len(w) >= 5}
+        topic_n = len(topic_words)
+        topic_stems_n = len(topic_stems)
+
+        # Only entries sharing a keyword or stem can clear the
+        # best_overlap >= 2 threshold; sorted keeps index order so
+        # ties still resolve to the earliest entry
+        candidates = set()
+        for term in topic_words | topic_stems:
+            candidates.update(kw_map.get(term, ()))
 
         best = None
-        for entry in index:
-            post_words = set(w.lower() for w in entry.get('keywords', []))
-            post_words -= STOPWORDS
+        for pos in sorted(candidates):
+            entry = index[pos]
+            post_words, post_stems = entry_terms[pos]
             if not post_words:
                 continue
 
-            overlap = topic_words & post_words
-            topic_stems = {w[:5] for w in topic_words if len(w) >= 5}
-            post_stems = {w[:5] for w in post_words if len(w) >= 5}
-            stem_overlap = topic_stems & post_stems
-            best_overlap = max(len(overlap), len(stem_overlap))
-            score = best_overlap / min(len(topic_words), len(post_words))
-
-            if score >= 0.4 and best_overlap >= 2:
-                if best is None or score > best['score']:
-                    best = {'msgId': entry['msgId'], 'topic': entry['topic'][:100],
-                            'score': round(score, 2), 'method': 'topic'}
+            # The stem intersection can never exceed the smaller stem
+            # set, so skip building it when the exact overlap already
+            # meets that bound; most candidates bail before the score
+            overlap_len = len(topic_words & post_words)
+            if overlap_len >= min(topic_stems_n, len(post_stems)):
+                best_overlap = overlap_len
+            else:
+                best_overlap = max(overlap_len, len(topic_stems & post_stems))
+            if best_overlap < 2:
+                continue
+
+            score = best_overlap / min(topic_n, len(post_words))
+            if score >= 0.4 and (best is None or score > best['score']):
+                best = {'msgId': entry['msgId'], 'topic': entry['topic'][:100],
+                        'score': round(score, 2), 'method': 'topic'}
         return best
 
     return None
 
 
-def save_index(index_file, index):
-    """Save index list back to file, preserving versioned wrapper if present."""
-    wrapper = None
-    if os.path.exists(index_file):
-        try:
-            with open(index_file, 'r') as f:
-                existing = json.load(f)
-        except (json.JSONDecodeError, OSError):
-            existing = None
-        if isinstance(existing, dict) and 'version' in existing:
-            wrapper = {'version': existing['version'], 'posts': index}
-    with open(index_file, 'w') as f:
-        json.dump(wrapper if wrapper else index, f, ensure_ascii=False, indent=2)
+def save_index(index_file, index, wrapper_meta=None):
+    """Save index list back to file.
+
+    wrapper_meta is the second element of load_index()'s return value;
+    passing it restores the versioned wrapper without re-reading the
+    file.
+    """
+    if wrapper_meta:
+        payload = {'version': wrapper_meta['version'], 'posts': index}
+    else:
+        payload = index
+    # Temp file + atomic rename: an interrupted write can never leave a
+    # truncated index behind for load_index's corrupt-file path to find
+    tmp = index_file + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_json_dumps(payload))
+    os.replace(tmp, index_file)
 
 
 def check_statuses(posts, index):
@@ -279,10 +391,24 @@ def check_statuses(posts, index):
     warnings = []
     fixes = []
     index_adds = []
+    link_map, kw_map, entry_terms = build_index_lookup(index)
+
+    # Drafts often share a Source and/or Topic; identical inputs give
+    # identical matches, so look each combination up only once
+    match_cache = {}
+    _MISS = object()
 
     for post in posts:
         status = post.fields.get('Status', '')
-        match = find_in_index(post, index)
+        # Nothing can match an empty index — skip the keyword
+        # extraction and lookups, but keep the loop: published posts
+        # still need to be collected into index_adds
+        cache_key = (post.fields.get('Source', ''), post.fields.get('Topic', ''))
+        match = match_cache.get(cache_key, _MISS)
+        if match is _MISS:
+            match = (find_in_index(post, index, link_map, kw_map, entry_terms)
+                     if index else None)
+            match_cache[cache_key] = match
 
         if match and status != 'published':
             warnings.append((post.number, post.line, 'warning',
@@ -315,25 +441,32 @@ def check_statuses(posts, index):
 # ---------------------------------------------------------------------------
 
 def apply_fixes(content, fixes, posts):
-    """Replace Status values for matched posts. Returns new content."""
-    lines = content.split('\n')
+    """Replace Status values for matched posts. Returns (new_content, changed).
+
+    Splices 'published' into the Status value spans recorded by
+    parse_queue, so the work is O(#fixes) slices instead of splitting
+    and re-joining every line of the file.
+    """
+    span_by_line = {p.field_lines['Status']: p.field_spans['Status']
+                    for p in posts if 'Status' in p.field_lines}
 
-    # Build a map: line_number (1-based) -> new status
-    fix_map = {}
+    spans = set()
     for post_num, status_line, old_status in fixes:
-        fix_map[status_line] = old_status
+        span = span_by_line.get(status_line)
+        if span is not None and content[span[0]:span[1]] == old_status:
+            spans.add(span)
 
-    changed = 0
-    for lineno, old_status in fix_map.items():
-        idx = lineno - 1
-        if idx < len(lines):
-            old_line = lines[idx]
-            new_line = old_line.replace(f'**Status:** {old_status}', '**Status:** published')
-            if new_line != old_line:
-                lines[idx] = new_line
-                changed += 1
+    if not spans:
+        return content, 0
 
-    return '\n'.join(lines), changed
+    out = []
+    cursor = 0
+    for start, end in sorted(spans):
+        out.append(content[cursor:start])
+        out.append('published')
+        cursor = end
+    out.append(content[cursor:])
+    return ''.join(out), len(spans)
 
 
 # ---------------------------------------------------------------------------
@@ -368,14 +501,14 @@ def main(argv=None):
     fmt_errors, fmt_warnings = validate_format(posts)
 
     # Index cross-reference
-    index = load_index(index_path)
+    index, index_wrapper = load_index(index_path)
     status_warnings, fixes, index_adds = check_statuses(posts, index)
 
     # Auto-sync: add published posts missing from index (only with --fix)
     if args.fix and index_adds:
         index.extend(index_adds)
         index.sort(key=lambda x: x.get('msgId') or 0)
-        save_index(index_path, index)
+        save_index(index_path, index, index_wrapper)
 
     all_errors = fmt_errors
     all_warnings = fmt_warnings + status_warnings
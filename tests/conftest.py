@@ -1,8 +1,12 @@
+import contextlib
 import importlib.util
+import io
 import json
 import pathlib
+import shutil
 import subprocess
 import sys
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -23,8 +27,10 @@ validate_queue = importlib.util.module_from_spec(validate_spec)
 validate_spec.loader.exec_module(validate_queue)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_index():
+    """Shared read-only index. No test mutates it; tests that need a
+    private copy should deepcopy rather than widen this scope back."""
     return [
         {
             "msgId": 101,
@@ -52,14 +58,41 @@ def populated_index_file(tmp_path, sample_index):
 
 
 def run_cli(*args, base_dir=None):
-    cmd = [sys.executable, str(SCRIPT_PATH)]
+    """Invoke dedup-check's main() in-process.
+
+    Returns a CompletedProcess like the old subprocess runner did, but
+    without paying interpreter startup per test.
+    """
+    argv = []
     if base_dir is not None:
-        cmd += ["--base-dir", str(base_dir)]
-    cmd += list(args)
-    return subprocess.run(cmd, capture_output=True, text=True)
+        argv += ["--base-dir", str(base_dir)]
+    argv += [str(a) for a in args]
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = dedup_check.main(argv)
+        except SystemExit as e:  # argparse errors exit instead of returning
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return subprocess.CompletedProcess(argv, rc, out.getvalue(), err.getvalue())
 
 
 def run_tgcm_cli(*args, workspace=None):
+    """Invoke tgcm's main() in-process (same contract as run_cli)."""
+    argv = []
+    if workspace is not None:
+        argv += ["--workspace", str(workspace)]
+    argv += [str(a) for a in args]
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = tgcm.main(argv)
+        except SystemExit as e:  # argparse errors exit instead of returning
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return subprocess.CompletedProcess(argv, rc, out.getvalue(), err.getvalue())
+
+
+def run_tgcm_cli_subprocess(*args, workspace=None):
+    """Spawn tgcm.py as a real subprocess — entrypoint smoke coverage."""
     cmd = [sys.executable, str(TGCM_SCRIPT_PATH)]
     if workspace is not None:
         cmd += ["--workspace", str(workspace)]
@@ -67,10 +100,83 @@ def run_tgcm_cli(*args, workspace=None):
     return subprocess.run(cmd, capture_output=True, text=True)
 
 
+# orjson-backed JSON helpers, same soft-dependency pattern as the
+# scripts themselves; stdlib json when orjson is not installed.
+try:
+    import orjson as _fastjson
+
+    _json_loads = _fastjson.loads
+
+    def _json_dumps(obj):
+        return _fastjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def read_json_out(capsys):
+    """Parse the captured stdout of a JSON-emitting command."""
+    return _json_loads(capsys.readouterr().out)
+
+
+def read_json_file(path):
+    """Parse a JSON file (pathlib.Path)."""
+    return _json_loads(path.read_bytes())
+
+
+def write_json_file(path, obj):
+    """Serialize *obj* to a JSON file (pathlib.Path)."""
+    path.write_bytes(_json_dumps(obj))
+
+
+def get_channel_list_output(capsys, workspace):
+    """Run channel_list and return just its output, dropping any
+    capture left over from setup calls."""
+    capsys.readouterr()
+    tgcm.channel_list(str(workspace))
+    return capsys.readouterr().out
+
+
+@pytest.fixture()
+def mock_tg_api(monkeypatch):
+    """tg_api_call swapped for one MagicMock via monkeypatch.
+
+    Tests set return_value/side_effect on it instead of opening their
+    own patch.object context; monkeypatch handles the single teardown.
+    """
+    m = MagicMock()
+    monkeypatch.setattr(tgcm, "tg_api_call", m)
+    return m
+
+
+@pytest.fixture(scope="session")
+def _channel_template(tmp_path_factory):
+    """Workspace with 'testchan' initialized once, copied per test."""
+    tpl = tmp_path_factory.mktemp("channel-template")
+    tgcm.channel_init(str(tpl), "testchan")
+    return tpl
+
+
+@pytest.fixture()
+def fresh_channel(tmp_path, _channel_template):
+    """Private copy of the template: initialized, unbound 'testchan'."""
+    shutil.copytree(_channel_template / "tgcm", tmp_path / "tgcm")
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _bound_template(tmp_path_factory):
+    """Workspace with 'test-chan' initialized and bound once."""
+    tpl = tmp_path_factory.mktemp("bound-template")
+    tgcm.channel_init(str(tpl), "test-chan")
+    tgcm.channel_bind(str(tpl), "test-chan", "-100999")
+    return tpl
+
+
 @pytest.fixture()
-def tgcm_workspace(tmp_path):
+def tgcm_workspace(tmp_path, _bound_template):
     """Initialized workspace with one bound channel 'test-chan'."""
-    ws = tmp_path
-    tgcm.channel_init(str(ws), "test-chan")
-    tgcm.channel_bind(str(ws), "test-chan", "-100999")
-    return ws
+    shutil.copytree(_bound_template / "tgcm", tmp_path / "tgcm")
+    return tmp_path
@@ -3,6 +3,12 @@ import pytest
 from conftest import dedup_check
 
 
+@pytest.fixture()
+def single_post_index(request):
+    """One-post index built from a keywords tuple (indirect param)."""
+    return [{"msgId": 1, "topic": "t", "links": [], "keywords": list(request.param)}]
+
+
 class TestCheckTopicEmptyCases:
     def test_empty_index(self):
         assert dedup_check.check_topic("python asyncio tutorial", []) == []
@@ -56,24 +62,24 @@ class TestCheckTopicThresholds:
         assert matches[0]["score"] == 0.4
 
     @pytest.mark.parametrize(
-        "topic, keywords, expect_match",
+        "topic, single_post_index, expect_match",
         [
             # 2/5 = 0.4 -> match
-            ("alpha beta xxxxx yyyyy zzzzz", ["alpha", "beta", "gamma", "delta", "epsilon"], True),
+            ("alpha beta xxxxx yyyyy zzzzz", ("alpha", "beta", "gamma", "delta", "epsilon"), True),
             # 1/3 = 0.33 -> no match
-            ("alpha xxxxx yyyyy", ["alpha", "beta", "gamma"], False),
+            ("alpha xxxxx yyyyy", ("alpha", "beta", "gamma"), False),
             # 2/4 = 0.5 -> match
-            ("alpha beta xxxxx yyyyy", ["alpha", "beta", "gamma", "delta"], True),
+            ("alpha beta xxxxx yyyyy", ("alpha", "beta", "gamma", "delta"), True),
             # 2/2 = 1.0 -> match
-            ("alpha beta", ["alpha", "beta", "gamma"], True),
+            ("alpha beta", ("alpha", "beta", "gamma"), True),
             # 1/1 = 1.0 but overlap=1 < 2 -> no match
-            ("alpha", ["alpha", "beta"], False),
+            ("alpha", ("alpha", "beta"), False),
         ],
+        indirect=["single_post_index"],
         ids=["2of5", "1of3", "2of4", "2of2_full", "1of1_single"],
     )
-    def test_threshold_parametrized(self, topic, keywords, expect_match):
-        index = [{"msgId": 1, "topic": "t", "links": [], "keywords": keywords}]
-        matches = dedup_check.check_topic(topic, index)
+    def test_threshold_parametrized(self, topic, single_post_index, expect_match):
+        matches = dedup_check.check_topic(topic, single_post_index)
         assert (len(matches) > 0) == expect_match
 
 
@@ -6,6 +6,8 @@ import pytest
 
 from conftest import SCRIPT_PATH, run_cli
 
+_MS_RE = re.compile(r"\d+ms")
+
 
 class TestCliRebuild:
     def test_exit_code_zero(self, tmp_path):
@@ -61,6 +63,15 @@ class TestCliAdd:
         assert any(p["msgId"] == 0 for p in data)
 
 
+@pytest.fixture(scope="class")
+def cli_check_dir(tmp_path_factory):
+    """Base dir with one indexed post; the check tests only read it."""
+    d = tmp_path_factory.mktemp("cli_check")
+    run_cli("--add", "1", "--topic", "python asyncio tutorial beginners",
+            "--links", "https://example.com/article", base_dir=str(d))
+    return d
+
+
 class TestCliCheck:
     def test_no_args_exit_1(self, tmp_path):
         r = run_cli(base_dir=str(tmp_path))
@@ -82,22 +93,17 @@ class TestCliCheck:
         r = run_cli("--topic", "unique topic words here", base_dir=str(tmp_path))
         assert "no duplicates" in r.stdout.lower()
 
-    def test_duplicates_found_message(self, tmp_path):
-        # Create index with a known entry
-        run_cli("--add", "1", "--topic", "python asyncio tutorial beginners", base_dir=str(tmp_path))
-        r = run_cli("--topic", "python asyncio tutorial guide", base_dir=str(tmp_path))
+    def test_duplicates_found_message(self, cli_check_dir):
+        r = run_cli("--topic", "python asyncio tutorial guide", base_dir=str(cli_check_dir))
         assert "duplicates found" in r.stdout.lower() or "possible" in r.stdout.lower()
 
-    def test_link_duplicate_found(self, tmp_path):
-        run_cli("--add", "1", "--topic", "test topic here",
-                "--links", "https://example.com/article", base_dir=str(tmp_path))
-        r = run_cli("--links", "https://example.com/article", base_dir=str(tmp_path))
+    def test_link_duplicate_found(self, cli_check_dir):
+        r = run_cli("--links", "https://example.com/article", base_dir=str(cli_check_dir))
         assert "duplicates found" in r.stdout.lower() or "link" in r.stdout.lower()
 
-    def test_check_exit_0_even_with_matches(self, tmp_path):
+    def test_check_exit_0_even_with_matches(self, cli_check_dir):
         """Check mode always exits 0, even when duplicates are found."""
-        run_cli("--add", "1", "--topic", "python asyncio tutorial beginners", base_dir=str(tmp_path))
-        r = run_cli("--topic", "python asyncio tutorial guide", base_dir=str(tmp_path))
+        r = run_cli("--topic", "python asyncio tutorial guide", base_dir=str(cli_check_dir))
         assert r.returncode == 0
 
 
@@ -109,7 +115,7 @@ class TestCliPerfLog:
     def test_perf_log_contains_ms(self, tmp_path):
         run_cli("--topic", "some test topic here", base_dir=str(tmp_path))
         content = (tmp_path / "content-perf.log").read_text()
-        assert re.search(r"\d+ms", content)
+        assert _MS_RE.search(content)
 
     def test_perf_log_not_created_for_add(self, tmp_path):
         run_cli("--add", "1", "--topic", "Test topic here", base_dir=str(tmp_path))
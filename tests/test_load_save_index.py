@@ -49,8 +49,9 @@ class TestSaveIndex:
         f = tmp_path / "out.json"
         data = [{"msgId": 1, "topic": "test"}]
         dedup_check.save_index(str(f), data)
-        loaded = json.loads(f.read_text())
-        assert loaded == data
+        # Exact on-disk bytes, not just re-parsed equality — catches
+        # formatting regressions (indent, escaping) too
+        assert f.read_bytes() == dedup_check._json_dumps(data)
 
     def test_ensure_ascii_false(self, tmp_path):
         f = tmp_path / "out.json"
@@ -94,9 +95,8 @@ class TestVersionedFormat:
         f = tmp_path / "index.json"
         f.write_text(json.dumps({"version": 1, "posts": []}))
         dedup_check.save_index(str(f), [{"msgId": 5, "topic": "new"}])
-        raw = json.loads(f.read_text())
-        assert raw["version"] == 1
-        assert raw["posts"] == [{"msgId": 5, "topic": "new"}]
+        expected = {"version": 1, "posts": [{"msgId": 5, "topic": "new"}]}
+        assert f.read_bytes() == dedup_check._json_dumps(expected)
 
     def test_save_flat_stays_flat(self, tmp_path):
         f = tmp_path / "index.json"
@@ -1,7 +1,7 @@
 import json
 import os
 
-from conftest import tgcm
+from conftest import get_channel_list_output, tgcm
 
 
 class TestChannelList:
@@ -15,26 +15,21 @@ class TestChannelList:
 
     def test_single_channel(self, tmp_path, capsys):
         tgcm.channel_init(str(tmp_path), "alpha")
-        tgcm.channel_list(str(tmp_path))
-        out = capsys.readouterr().out
+        out = get_channel_list_output(capsys, tmp_path)
         assert "alpha" in out
         assert "status=initialized" in out
 
     def test_multiple_channels_sorted(self, tmp_path, capsys):
         tgcm.channel_init(str(tmp_path), "beta")
         tgcm.channel_init(str(tmp_path), "alpha")
-        capsys.readouterr()  # clear init output
-        tgcm.channel_list(str(tmp_path))
-        out = capsys.readouterr().out
+        out = get_channel_list_output(capsys, tmp_path)
         lines = [l for l in out.strip().split("\n") if l.strip()]
         assert lines[0].startswith("alpha")
         assert lines[1].startswith("beta")
 
-    def test_connected_channel_shows_id(self, tmp_path, capsys):
-        tgcm.channel_init(str(tmp_path), "testchan")
-        tgcm.channel_bind(str(tmp_path), "testchan", "-100123")
-        tgcm.channel_list(str(tmp_path))
-        out = capsys.readouterr().out
+    def test_connected_channel_shows_id(self, fresh_channel, capsys):
+        tgcm.channel_bind(str(fresh_channel), "testchan", "-100123")
+        out = get_channel_list_output(capsys, fresh_channel)
         assert "-100123" in out
         assert "status=connected" in out
 
@@ -1,6 +1,8 @@
 import json
 
-from conftest import run_tgcm_cli
+import pytest
+
+from conftest import run_tgcm_cli, run_tgcm_cli_subprocess
 
 
 class TestCliInit:
@@ -63,23 +65,26 @@ class TestCliConnect:
         assert data["status"] == "new_channel"
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """One fully-registered parser shared by the parse_args tests."""
+    from conftest import tgcm
+    return tgcm.build_parser()
+
+
 class TestCliGetId:
     def test_missing_bot_token_exit_1(self, tmp_path):
         r = run_tgcm_cli("get-id", "@testchannel", workspace=str(tmp_path))
         assert r.returncode == 1
         assert "bot token" in r.stderr.lower()
 
-    def test_parser_accepts_username(self):
-        from conftest import tgcm
-        parser = tgcm.build_parser()
+    def test_parser_accepts_username(self, parser):
         args = parser.parse_args(["--bot-token", "fake", "get-id", "@mychan"])
         assert args.command == "get-id"
         assert args.identifier == "@mychan"
         assert args.bot_token == "fake"
 
-    def test_parser_accepts_numeric_id(self):
-        from conftest import tgcm
-        parser = tgcm.build_parser()
+    def test_parser_accepts_numeric_id(self, parser):
         args = parser.parse_args(["--bot-token", "fake", "get-id", "-100123456"])
         assert args.command == "get-id"
         assert args.identifier == "-100123456"
@@ -89,3 +94,11 @@ class TestCliNoArgs:
     def test_no_args_exit_1(self, tmp_path):
         r = run_tgcm_cli(workspace=str(tmp_path))
         assert r.returncode == 1
+
+
+class TestCliEntrypoint:
+    def test_subprocess_smoke(self, tmp_path):
+        """The script entrypoint itself still works as a subprocess."""
+        r = run_tgcm_cli_subprocess("list", workspace=str(tmp_path))
+        assert r.returncode == 0
+        assert "No channels found" in r.stdout
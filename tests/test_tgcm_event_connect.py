@@ -1,13 +1,11 @@
-import json
-
-from conftest import tgcm
+from conftest import read_json_out, tgcm
 
 
 class TestEventConnect:
     def test_outputs_new_channel_json(self, tmp_path, capsys):
         result = tgcm.event_connect(str(tmp_path), "-100123")
         assert result == 0
-        out = json.loads(capsys.readouterr().out)
+        out = read_json_out(capsys)
         assert out["status"] == "new_channel"
         assert out["channelId"] == "-100123"
         assert "-100123" in out["instructions"]
@@ -16,22 +14,21 @@ class TestEventConnect:
         tgcm.event_connect(
             str(tmp_path), "-100123", channel_title="My Channel",
         )
-        out = json.loads(capsys.readouterr().out)
+        out = read_json_out(capsys)
         assert "My Channel" in out["instructions"]
 
-    def test_already_connected(self, tmp_path, capsys):
-        tgcm.channel_init(str(tmp_path), "testchan")
-        tgcm.channel_bind(str(tmp_path), "testchan", "-100123")
+    def test_already_connected(self, fresh_channel, capsys):
+        tgcm.channel_bind(str(fresh_channel), "testchan", "-100123")
         capsys.readouterr()  # clear
 
-        result = tgcm.event_connect(str(tmp_path), "-100123")
+        result = tgcm.event_connect(str(fresh_channel), "-100123")
         assert result == 0
-        out = json.loads(capsys.readouterr().out)
+        out = read_json_out(capsys)
         assert out["status"] == "already_connected"
         assert out["channel"] == "testchan"
 
     def test_no_tgcm_dir_still_works(self, tmp_path, capsys):
         result = tgcm.event_connect(str(tmp_path), "-100999")
         assert result == 0
-        out = json.loads(capsys.readouterr().out)
+        out = read_json_out(capsys)
         assert out["status"] == "new_channel"
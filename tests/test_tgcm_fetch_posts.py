@@ -27,16 +27,16 @@ class TestParseTmePostsBasic:
 
     def test_extracts_msg_ids(self):
         posts = tgcm.parse_tme_posts(self.SAMPLE_HTML)
-        ids = [p["msgId"] for p in posts]
+        ids = [p.msgId for p in posts]
         assert ids == [101, 102]
 
     def test_extracts_text(self):
         posts = tgcm.parse_tme_posts(self.SAMPLE_HTML)
-        assert "first post" in posts[0]["text"]
+        assert "first post" in posts[0].text
 
     def test_extracts_date(self):
         posts = tgcm.parse_tme_posts(self.SAMPLE_HTML)
-        assert posts[0]["date"] == "2025-01-15T10:00:00+00:00"
+        assert posts[0].date == "2025-01-15T10:00:00+00:00"
 
 
 class TestParseTmePostsSkipsShort:
@@ -77,8 +77,8 @@ class TestParseTmePostsExtractsLinks:
     def test_extracts_links(self):
         posts = tgcm.parse_tme_posts(self.HTML)
         assert len(posts) == 1
-        assert "https://example.com/article" in posts[0]["links"]
-        assert "https://blog.example.com/post" in posts[0]["links"]
+        assert "https://example.com/article" in posts[0].links
+        assert "https://blog.example.com/post" in posts[0].links
 
 
 class TestParseTmePostsNestedDivs:
@@ -98,11 +98,11 @@ class TestParseTmePostsNestedDivs:
     def test_captures_text_after_nested_div(self):
         posts = tgcm.parse_tme_posts(self.HTML)
         assert len(posts) == 1
-        assert "closing paragraph" in posts[0]["text"]
+        assert "closing paragraph" in posts[0].text
 
     def test_captures_text_inside_nested_div(self):
         posts = tgcm.parse_tme_posts(self.HTML)
-        assert "blockquote" in posts[0]["text"]
+        assert "blockquote" in posts[0].text
 
 
 class TestStripHtmlTags:
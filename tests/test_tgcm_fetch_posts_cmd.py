@@ -1,9 +1,8 @@
-import json
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from conftest import tgcm
+from conftest import read_json_file, tgcm, write_json_file
 
 
 SAMPLE_HTML = """
@@ -22,6 +21,15 @@ SAMPLE_HTML = """
 """
 
 
+@pytest.fixture(scope="session")
+def sample_posts():
+    """SAMPLE_HTML parsed once per session. Tests that only need post
+    semantics patch parse_tme_posts with this instead of re-parsing the
+    same HTML per test; TestFetchPostsCmdPagination keeps the real
+    parser so one path still exercises HTML end to end."""
+    return tgcm.parse_tme_posts(SAMPLE_HTML)
+
+
 class TestFetchPostsCmdChannelNotFound:
     def test_returns_1(self, tmp_path, capsys):
         rc = tgcm.fetch_posts_cmd(str(tmp_path), "nosuch", None, 5, False)
@@ -61,14 +69,15 @@ class TestFetchPostsCmdPrivateChannel:
 
 
 class TestFetchPostsCmdDryRun:
-    def test_dry_run_does_not_modify_index(self, tgcm_workspace, capsys):
+    def test_dry_run_does_not_modify_index(self, tgcm_workspace, sample_posts, capsys):
         def mock_api(token, method, params=None):
             if method == "getChat":
                 return {"type": "channel", "title": "T", "username": "testchan"}
             return None
 
         with patch.object(tgcm, "tg_api_call", side_effect=mock_api), \
-             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML):
+             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML), \
+             patch.object(tgcm, "parse_tme_posts", return_value=sample_posts):
             rc = tgcm.fetch_posts_cmd(str(tgcm_workspace), "test-chan", "fake-tok", 1, True)
 
         assert rc == 0
@@ -76,20 +85,21 @@ class TestFetchPostsCmdDryRun:
         assert "Would add" in out
 
         index_path = tgcm_workspace / "tgcm" / "test-chan" / "content-index.json"
-        data = json.loads(index_path.read_text())
+        data = read_json_file(index_path)
         posts = data["posts"] if isinstance(data, dict) else data
         assert len(posts) == 0
 
 
 class TestFetchPostsCmdAddsToIndex:
-    def test_adds_new_posts(self, tgcm_workspace, capsys):
+    def test_adds_new_posts(self, tgcm_workspace, sample_posts, capsys):
         def mock_api(token, method, params=None):
             if method == "getChat":
                 return {"type": "channel", "title": "T", "username": "testchan"}
             return None
 
         with patch.object(tgcm, "tg_api_call", side_effect=mock_api), \
-             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML):
+             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML), \
+             patch.object(tgcm, "parse_tme_posts", return_value=sample_posts):
             rc = tgcm.fetch_posts_cmd(str(tgcm_workspace), "test-chan", "fake-tok", 1, False)
 
         assert rc == 0
@@ -97,18 +107,18 @@ class TestFetchPostsCmdAddsToIndex:
         assert "Added 2 new posts" in out
 
         index_path = tgcm_workspace / "tgcm" / "test-chan" / "content-index.json"
-        data = json.loads(index_path.read_text())
+        data = read_json_file(index_path)
         assert len(data["posts"]) == 2
 
 
 class TestFetchPostsCmdSkipsDuplicates:
-    def test_skips_existing_ids(self, tgcm_workspace, capsys):
+    def test_skips_existing_ids(self, tgcm_workspace, sample_posts, capsys):
         # Pre-populate index with msgId 1
         index_path = tgcm_workspace / "tgcm" / "test-chan" / "content-index.json"
-        index_path.write_text(json.dumps({
+        write_json_file(index_path, {
             "version": 1,
-            "posts": [{"msgId": 1, "topic": "old", "links": [], "keywords": ["old"]}]
-        }))
+            "posts": [{"msgId": 1, "topic": "old", "links": [], "keywords": ["old"]}],
+        })
 
         def mock_api(token, method, params=None):
             if method == "getChat":
@@ -116,7 +126,8 @@ class TestFetchPostsCmdSkipsDuplicates:
             return None
 
         with patch.object(tgcm, "tg_api_call", side_effect=mock_api), \
-             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML):
+             patch.object(tgcm, "fetch_tme_page", return_value=SAMPLE_HTML), \
+             patch.object(tgcm, "parse_tme_posts", return_value=sample_posts):
             rc = tgcm.fetch_posts_cmd(str(tgcm_workspace), "test-chan", "fake-tok", 1, False)
 
         assert rc == 0
@@ -125,6 +136,16 @@ class TestFetchPostsCmdSkipsDuplicates:
         assert "1 already existed" in out
 
 
+def _page_html(first_id, last_id):
+    """Build a t.me/s/ page with one post per msgId in [first_id, last_id]."""
+    return "\n".join(
+        f'<div data-post="testchan/{mid}">'
+        f'<div class="tgme_widget_message_text">Post number {mid} body</div>'
+        f'<time datetime="2025-01-01"></time></div>'
+        for mid in range(first_id, last_id + 1)
+    )
+
+
 class TestFetchPostsCmdPagination:
     def test_stops_on_small_page(self, tgcm_workspace, capsys):
         call_count = [0]
@@ -143,3 +164,66 @@ class TestFetchPostsCmdPagination:
 
         # Only 2 posts per page < MIN_PAGE_SIZE(10), should stop after 1 page
         assert call_count[0] == 1
+
+    def test_prefetch_offsets_and_dedup(self, tgcm_workspace, capsys):
+        """Deep pages are prefetched at stride-guessed offsets and the
+        overlap between speculative pages is deduped by msgId."""
+        calls = []
+
+        def mock_fetch(username, before=None):
+            calls.append(before)
+            if before is None:
+                return _page_html(101, 112)  # 12 posts >= MIN_PAGE_SIZE
+            # each deeper page overlaps the guess boundary by one post
+            return _page_html(before - 11, before)
+
+        def mock_api(token, method, params=None):
+            if method == "getChat":
+                return {"type": "channel", "title": "T", "username": "testchan"}
+            return None
+
+        with patch.object(tgcm, "tg_api_call", side_effect=mock_api), \
+             patch.object(tgcm, "fetch_tme_page", side_effect=mock_fetch):
+            rc = tgcm.fetch_posts_cmd(str(tgcm_workspace), "test-chan", "fake-tok", 3, False)
+
+        assert rc == 0
+        # page 1 spans 101-112 (stride 12): guesses are min_id - stride*k
+        assert calls == [None, 101, 89]
+        # pages cover 78-89, 90-101 and 101-112; 101 is fetched twice but
+        # indexed once, so 78..112 = 35 unique posts
+        out = capsys.readouterr().out
+        assert "Added 35 new posts" in out
+        index_path = tgcm_workspace / "tgcm" / "test-chan" / "content-index.json"
+        assert len(read_json_file(index_path)["posts"]) == 35
+
+    def test_all_indexed_page1_skips_deeper_fetches(self, tgcm_workspace, capsys):
+        """A fully pre-indexed page 1 ends the run after one fetch even
+        when the page is large enough to paginate."""
+        index_path = tgcm_workspace / "tgcm" / "test-chan" / "content-index.json"
+        write_json_file(index_path, {
+            "version": 1,
+            "posts": [
+                {"msgId": mid, "topic": f"old {mid}", "links": [], "keywords": []}
+                for mid in range(101, 113)
+            ],
+        })
+        call_count = [0]
+
+        def mock_fetch(username, before=None):
+            call_count[0] += 1
+            return _page_html(101, 112)  # >= MIN_PAGE_SIZE, all indexed
+
+        def mock_api(token, method, params=None):
+            if method == "getChat":
+                return {"type": "channel", "title": "T", "username": "testchan"}
+            return None
+
+        with patch.object(tgcm, "tg_api_call", side_effect=mock_api), \
+             patch.object(tgcm, "fetch_tme_page", side_effect=mock_fetch):
+            rc = tgcm.fetch_posts_cmd(str(tgcm_workspace), "test-chan", "fake-tok", 5, False)
+
+        assert rc == 0
+        assert call_count[0] == 1
+        out = capsys.readouterr().out
+        assert "already indexed, skipping deeper pages" in out
+        assert "Added 0 new posts" in out
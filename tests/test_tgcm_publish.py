@@ -3,51 +3,63 @@ import json
 import sys
 from unittest.mock import patch
 
+import pytest
+
 from conftest import run_tgcm_cli, tgcm
 
 
+# The chat sub-dict never varies, so every message shares one instance;
+# no test mutates the returned messages.
+_CHAT = {"id": -100999}
+
+
 def _make_msg(message_id):
-    return {"message_id": message_id, "chat": {"id": -100999}}
+    return {"message_id": message_id, "chat": _CHAT}
+
+
+@pytest.fixture(scope="session")
+def long_split_text():
+    """Canonical over-caption-limit text, built once for the split tests."""
+    return "A" * 500 + "\n\n" + "B" * 600
 
 
 class TestPublishPostShortTextNoPhoto:
-    def test_sends_message(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(1)) as mock:
-            result = tgcm.publish_post("tok", "-100", "hello")
+    def test_sends_message(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(1)
+        result = tgcm.publish_post("tok", "-100", "hello")
         assert result == [_make_msg(1)]
-        mock.assert_called_once()
-        call_args = mock.call_args
+        mock_tg_api.assert_called_once()
+        call_args = mock_tg_api.call_args
         assert call_args[0][1] == "sendMessage"
         assert call_args[1]["json_body"]["text"] == "hello"
 
 
 class TestPublishPostShortTextWithPhoto:
-    def test_sends_photo(self):
+    def test_sends_photo(self, mock_tg_api):
         text = "short caption"
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(2)) as mock:
-            result = tgcm.publish_post("tok", "-100", text, photo_url="http://img.jpg")
+        mock_tg_api.return_value = _make_msg(2)
+        result = tgcm.publish_post("tok", "-100", text, photo_url="http://img.jpg")
         assert result == [_make_msg(2)]
-        mock.assert_called_once()
-        call_args = mock.call_args
+        mock_tg_api.assert_called_once()
+        call_args = mock_tg_api.call_args
         assert call_args[0][1] == "sendPhoto"
         assert call_args[1]["json_body"]["caption"] == text
 
 
 class TestPublishPostLongTextWithPhotoSplits:
-    def test_two_api_calls(self):
-        text = "A" * 500 + "\n\n" + "B" * 600
-        msgs = [_make_msg(3), _make_msg(4)]
-        with patch.object(tgcm, "tg_api_call", side_effect=msgs) as mock:
-            result = tgcm.publish_post("tok", "-100", text, photo_url="http://img.jpg")
+    def test_two_api_calls(self, mock_tg_api, long_split_text):
+        mock_tg_api.side_effect = [_make_msg(3), _make_msg(4)]
+        result = tgcm.publish_post(
+            "tok", "-100", long_split_text, photo_url="http://img.jpg")
         assert len(result) == 2
-        assert mock.call_count == 2
-        assert mock.call_args_list[0][0][1] == "sendPhoto"
-        assert mock.call_args_list[1][0][1] == "sendMessage"
+        assert mock_tg_api.call_count == 2
+        assert mock_tg_api.call_args_list[0][0][1] == "sendPhoto"
+        assert mock_tg_api.call_args_list[1][0][1] == "sendMessage"
 
 
 class TestSplitAtParagraphBoundary:
-    def test_splits_at_double_newline(self):
-        head, tail = tgcm._split_text("A" * 500 + "\n\n" + "B" * 600, 1024)
+    def test_splits_at_double_newline(self, long_split_text):
+        head, tail = tgcm._split_text(long_split_text, 1024)
         assert head == "A" * 500
         assert tail == "B" * 600
 
@@ -89,20 +101,20 @@ class TestSplitAtSpaceIfNoNewline:
 
 
 class TestApiErrorReturnsNone:
-    def test_sendmessage_error(self):
-        with patch.object(tgcm, "tg_api_call", return_value=None):
-            result = tgcm.publish_post("tok", "-100", "hello")
+    def test_sendmessage_error(self, mock_tg_api):
+        mock_tg_api.return_value = None
+        result = tgcm.publish_post("tok", "-100", "hello")
         assert result is None
 
-    def test_sendphoto_error(self):
-        with patch.object(tgcm, "tg_api_call", return_value=None):
-            result = tgcm.publish_post("tok", "-100", "hi", photo_url="http://img.jpg")
+    def test_sendphoto_error(self, mock_tg_api):
+        mock_tg_api.return_value = None
+        result = tgcm.publish_post("tok", "-100", "hi", photo_url="http://img.jpg")
         assert result is None
 
-    def test_second_message_error(self):
-        text = "A" * 500 + "\n\n" + "B" * 600
-        with patch.object(tgcm, "tg_api_call", side_effect=[_make_msg(1), None]):
-            result = tgcm.publish_post("tok", "-100", text, photo_url="http://img.jpg")
+    def test_second_message_error(self, mock_tg_api, long_split_text):
+        mock_tg_api.side_effect = [_make_msg(1), None]
+        result = tgcm.publish_post(
+            "tok", "-100", long_split_text, photo_url="http://img.jpg")
         assert result is None
 
 
@@ -132,15 +144,15 @@ class TestCliPublishMissingTextExit1:
 
 
 class TestPublishParseMode:
-    def test_parse_mode_passed(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(5)) as mock:
-            tgcm.publish_post("tok", "-100", "hi", parse_mode="HTML")
-        assert mock.call_args[1]["json_body"]["parse_mode"] == "HTML"
+    def test_parse_mode_passed(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(5)
+        tgcm.publish_post("tok", "-100", "hi", parse_mode="HTML")
+        assert mock_tg_api.call_args[1]["json_body"]["parse_mode"] == "HTML"
 
-    def test_no_parse_mode_omitted(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(6)) as mock:
-            tgcm.publish_post("tok", "-100", "hi")
-        assert "parse_mode" not in mock.call_args[1]["json_body"]
+    def test_no_parse_mode_omitted(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(6)
+        tgcm.publish_post("tok", "-100", "hi")
+        assert "parse_mode" not in mock_tg_api.call_args[1]["json_body"]
 
 
 # --- Markdown → Telegram HTML tests ---
@@ -232,54 +244,68 @@ class TestMdToTgHtml:
         result = tgcm.md_to_tg_html(text)
         assert result == "<blockquote>quote</blockquote>\nregular"
 
+    def test_nested_code_inside_bold(self):
+        assert tgcm.md_to_tg_html("**bold `code` inside**") == \
+            "<b>bold <code>code</code> inside</b>"
+
+    def test_nested_bold_inside_code(self):
+        assert tgcm.md_to_tg_html("`code **bold** inside`") == \
+            "<code>code <b>bold</b> inside</code>"
+
+    def test_interleaved_markers_resolve_left_to_right(self):
+        """Spans pair left-to-right and never straddle each other's
+        boundaries: the leftmost complete span wins and stray markers
+        inside or after it stay literal (no improperly nested HTML)."""
+        assert tgcm.md_to_tg_html("**a`b**c`d") == "<b>a`b</b>c`d"
+        assert tgcm.md_to_tg_html("`a**b`c**d") == "<code>a**b</code>c**d"
+
 
 class TestPublishWithFormatMd:
-    def test_md_format_converts_and_sets_html(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(20)) as mock:
-            tgcm.publish_post("tok", "-100", "### Title", text_format="md")
-        body = mock.call_args[1]["json_body"]
+    def test_md_format_converts_and_sets_html(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(20)
+        tgcm.publish_post("tok", "-100", "### Title", text_format="md")
+        body = mock_tg_api.call_args[1]["json_body"]
         assert body["text"] == "<b>Title</b>"
         assert body["parse_mode"] == "HTML"
 
-    def test_no_format_no_conversion(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(21)) as mock:
-            tgcm.publish_post("tok", "-100", "### Title")
-        body = mock.call_args[1]["json_body"]
+    def test_no_format_no_conversion(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(21)
+        tgcm.publish_post("tok", "-100", "### Title")
+        body = mock_tg_api.call_args[1]["json_body"]
         assert body["text"] == "### Title"
         assert "parse_mode" not in body
 
-    def test_plain_format_no_conversion(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(22)) as mock:
-            tgcm.publish_post("tok", "-100", "### Title", text_format="plain")
-        body = mock.call_args[1]["json_body"]
+    def test_plain_format_no_conversion(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(22)
+        tgcm.publish_post("tok", "-100", "### Title", text_format="plain")
+        body = mock_tg_api.call_args[1]["json_body"]
         assert body["text"] == "### Title"
 
-    def test_md_format_with_photo_short(self):
-        with patch.object(tgcm, "tg_api_call", return_value=_make_msg(23)) as mock:
-            tgcm.publish_post(
-                "tok", "-100", "**bold**",
-                photo_url="http://img.jpg", text_format="md",
-            )
-        body = mock.call_args[1]["json_body"]
+    def test_md_format_with_photo_short(self, mock_tg_api):
+        mock_tg_api.return_value = _make_msg(23)
+        tgcm.publish_post(
+            "tok", "-100", "**bold**",
+            photo_url="http://img.jpg", text_format="md",
+        )
+        body = mock_tg_api.call_args[1]["json_body"]
         assert body["caption"] == "<b>bold</b>"
         assert body["parse_mode"] == "HTML"
 
-    def test_md_format_with_photo_split(self):
+    def test_md_format_with_photo_split(self, mock_tg_api):
         head_md = "### Head\n" + "A" * 500
         tail_md = "### Tail\n" + "B" * 600
         text = head_md + "\n\n" + tail_md
-        msgs = [_make_msg(24), _make_msg(25)]
-        with patch.object(tgcm, "tg_api_call", side_effect=msgs) as mock:
-            tgcm.publish_post(
-                "tok", "-100", text,
-                photo_url="http://img.jpg", text_format="md",
-            )
-        caption = mock.call_args_list[0][1]["json_body"]["caption"]
-        text2 = mock.call_args_list[1][1]["json_body"]["text"]
+        mock_tg_api.side_effect = [_make_msg(24), _make_msg(25)]
+        tgcm.publish_post(
+            "tok", "-100", text,
+            photo_url="http://img.jpg", text_format="md",
+        )
+        caption = mock_tg_api.call_args_list[0][1]["json_body"]["caption"]
+        text2 = mock_tg_api.call_args_list[1][1]["json_body"]["text"]
         assert "<b>Head</b>" in caption
         assert "<b>Tail</b>" in text2
-        assert mock.call_args_list[0][1]["json_body"]["parse_mode"] == "HTML"
-        assert mock.call_args_list[1][1]["json_body"]["parse_mode"] == "HTML"
+        assert mock_tg_api.call_args_list[0][1]["json_body"]["parse_mode"] == "HTML"
+        assert mock_tg_api.call_args_list[1][1]["json_body"]["parse_mode"] == "HTML"
 
 
 class TestCliPublishFormatMd:
@@ -31,13 +31,11 @@ class TestResolveBotToken:
         monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
         oc = tmp_path / "openclaw.json"
         oc.write_text(json.dumps({"channels": {"telegram": {"botToken": "oc-tok"}}}))
-        monkeypatch.chdir(tmp_path)
-        result = tgcm.resolve_bot_token(None, str(tmp_path))
+        result = tgcm.resolve_bot_token(None, str(tmp_path), cwd=str(tmp_path))
         assert result == "oc-tok"
 
     def test_local_config_fifth(self, tmp_path, monkeypatch):
         monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
-        monkeypatch.chdir(tmp_path)
         tgcm_root = tmp_path / "tgcm"
         tgcm_root.mkdir()
         cfg = tgcm_root / ".config.json"
@@ -48,7 +46,6 @@ class TestResolveBotToken:
 
     def test_returns_none_when_nothing(self, tmp_path, monkeypatch):
         monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
-        monkeypatch.chdir(tmp_path)
         with patch.object(tgcm, "find_openclaw_config", return_value=None):
             result = tgcm.resolve_bot_token(None, str(tmp_path))
         assert result is None
@@ -78,7 +75,6 @@ class TestResolveTokenSource:
 
     def test_none_none_when_nothing(self, tmp_path, monkeypatch):
         monkeypatch.delenv("TELEGRAM_BOT_TOKEN", raising=False)
-        monkeypatch.chdir(tmp_path)
         with patch.object(tgcm, "find_openclaw_config", return_value=None):
             tok, src = tgcm.resolve_token_source(None, str(tmp_path))
         assert tok is None
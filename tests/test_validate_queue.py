@@ -1,12 +1,13 @@
 """Tests for validate-queue.py"""
 
+import contextlib
+import io
 import json
 import subprocess
-import sys
 
 import pytest
 
-from conftest import validate_queue, VALIDATE_SCRIPT_PATH
+from conftest import validate_queue
 
 
 # ---------------------------------------------------------------------------
@@ -64,11 +65,18 @@ SUBHEADING_POST = """\
 
 
 def run_validate_cli(*args, base_dir=None):
-    cmd = [sys.executable, str(VALIDATE_SCRIPT_PATH)]
+    """Invoke validate-queue's main() in-process (same contract as run_cli)."""
+    argv = []
     if base_dir is not None:
-        cmd += ["--base-dir", str(base_dir)]
-    cmd += list(args)
-    return subprocess.run(cmd, capture_output=True, text=True)
+        argv += ["--base-dir", str(base_dir)]
+    argv += [str(a) for a in args]
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = validate_queue.main(argv)
+        except SystemExit as e:  # argparse errors exit instead of returning
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return subprocess.CompletedProcess(argv, rc, out.getvalue(), err.getvalue())
 
 
 # ---------------------------------------------------------------------------